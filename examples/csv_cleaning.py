@@ -21,9 +21,14 @@ CLI equivalent:
 """
 
 import os
+import re
 from pathlib import Path
 
 from datawash import analyze
+from datawash.adapters.csv_adapter import write_csv_fast
+
+# Suggestions left for manual review: date standardization and outlier handling
+SKIP_RE = re.compile(r"standardize.*date|date.*standardize|outlier", re.IGNORECASE)
 
 
 def main():
@@ -96,16 +101,10 @@ def main():
     ids_to_skip = []
 
     for s in report.suggestions:
-        # Skip date standardization
-        if "date" in s.action.lower() and "standardize" in s.action.lower():
-            ids_to_skip.append((s.id, s.action))
-            continue
-        # Skip outlier handling (manual review preferred)
-        if "outlier" in s.action.lower():
+        if SKIP_RE.search(s.action):
             ids_to_skip.append((s.id, s.action))
-            continue
-        # Apply everything else
-        ids_to_apply.append(s.id)
+        else:
+            ids_to_apply.append(s.id)
 
     print(f"\nApplying {len(ids_to_apply)} suggestions: {ids_to_apply}")
     if ids_to_skip:
@@ -142,7 +141,7 @@ def main():
     print("STEP 6: Saving cleaned CSV")
     print("=" * 70)
 
-    clean_df.to_csv(output_file, index=False)
+    write_csv_fast(clean_df, output_file)
     print(f"Saved to: {output_file}")
     print(f"File size: {os.path.getsize(output_file) / 1024:.1f} KB")
 
@@ -143,16 +143,16 @@ def main():
     print("=" * 70)
 
     print("\nData types after cleaning:")
-    for col in clean_df.columns:
-        dtype = clean_df[col].dtype
-        null_count = clean_df[col].isna().sum()
-        print(f"  {col:20} {str(dtype):15} (nulls: {null_count})")
+    dtypes = clean_df.dtypes
+    nulls = clean_df.isna().sum()
+    for col, dtype in dtypes.items():
+        print(f"  {col:20} {str(dtype):15} (nulls: {nulls[col]})")
 
     # Check for remaining issues
     print("\nML Readiness:")
 
     # No nulls?
-    total_nulls = clean_df.isna().sum().sum()
+    total_nulls = nulls.sum()
     print(
         f"  Missing values: {'PASS' if total_nulls == 0 else f'FAIL ({total_nulls} remaining)'}"
     )
@@ -160,16 +160,14 @@ def main():
     # Numeric columns are numeric?
     numeric_cols = ["salary", "performance_score", "years_experience"]
     numeric_ok = all(
-        pd.api.types.is_numeric_dtype(clean_df[c])
-        for c in numeric_cols
-        if c in clean_df.columns
+        pd.api.types.is_numeric_dtype(dtypes[c]) for c in numeric_cols if c in dtypes
     )
     print(f"  Numeric types: {'PASS' if numeric_ok else 'FAIL'}")
 
     # Boolean column is boolean?
     bool_ok = (
-        clean_df["is_manager"].dtype == bool
-        if "is_manager" in clean_df.columns
+        pd.api.types.is_bool_dtype(dtypes["is_manager"])
+        if "is_manager" in dtypes
         else True
     )
     print(f"  Boolean types: {'PASS' if bool_ok else 'FAIL'}")
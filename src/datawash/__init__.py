@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
-from datawash.core.report import analyze
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from datawash.core.report import analyze
 
 __version__ = "0.2.2"
 
 __all__ = ["analyze", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # Deferred so the CLI can show --help without importing pandas
+    if name == "analyze":
+        from datawash.core.report import analyze
+
+        return analyze
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
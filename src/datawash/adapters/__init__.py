@@ -1,12 +1,8 @@
-"""Data adapters for loading and saving DataFrames."""
+"""Data adapters for loading and saving DataFrames.
+
+Format adapters register themselves when first needed (see ``base._LAZY``).
+"""
 
-# Import adapters to trigger registration
-from datawash.adapters import (
-    csv_adapter,  # noqa: F401
-    excel_adapter,  # noqa: F401
-    json_adapter,  # noqa: F401
-    parquet_adapter,  # noqa: F401
-)
 from datawash.adapters.base import load_dataframe
 
 __all__ = ["load_dataframe"]
@@ -1,44 +1,115 @@
-"""Base adapter interface and loader dispatch."""
+"""Reader/writer registry and loader dispatch."""
 
 from __future__ import annotations
 
+import importlib
 import logging
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Any, Optional, Protocol
+from typing import Any, Optional, overload
 
 import pandas as pd
 
+from datawash.core import disk_cache
 from datawash.core.exceptions import AdapterError
 
 logger = logging.getLogger(__name__)
 
 
-class DataAdapter(Protocol):
-    """Protocol for data adapters."""
+# Readers are called as reader(path, fast_io=..., **kwargs)
+Reader = Callable[..., pd.DataFrame]
+ChunkReader = Callable[..., Iterator[pd.DataFrame]]
+Writer = Callable[..., None]
 
-    def read(self, path: Path, **kwargs: Any) -> pd.DataFrame: ...
-    def write(self, df: pd.DataFrame, path: Path, **kwargs: Any) -> None: ...
+# Extension -> bare function tables, so a load is one dict lookup and a call
+_READERS: dict[str, Reader] = {}
+_CHUNK_READERS: dict[str, ChunkReader] = {}
+_WRITERS: dict[str, Writer] = {}
 
+# Adapter modules are imported on first use so ``import datawash`` does not
+# pull in the Excel/Parquet stacks; importing a module registers its formats.
+_LAZY: dict[str, str] = {
+    "csv": "datawash.adapters.csv_adapter",
+    "tsv": "datawash.adapters.csv_adapter",
+    "xlsx": "datawash.adapters.excel_adapter",
+    "xls": "datawash.adapters.excel_adapter",
+    "json": "datawash.adapters.json_adapter",
+    "parquet": "datawash.adapters.parquet_adapter",
+}
 
-_ADAPTERS: dict[str, DataAdapter] = {}
 
+def register_reader(extension: str, fn: Reader) -> None:
+    _READERS[extension] = fn
 
-def register_adapter(extension: str, adapter: DataAdapter) -> None:
-    _ADAPTERS[extension] = adapter
+
+def register_chunk_reader(extension: str, fn: ChunkReader) -> None:
+    _CHUNK_READERS[extension] = fn
+
+
+def register_writer(extension: str, fn: Writer) -> None:
+    _WRITERS[extension] = fn
+
+
+def _ensure_registered(extension: str) -> None:
+    if extension not in _READERS and extension in _LAZY:
+        importlib.import_module(_LAZY[extension])
+
+
+def get_writer(extension: str) -> Optional[Writer]:
+    """Return the writer registered for ``extension``, or None."""
+    _ensure_registered(extension)
+    return _WRITERS.get(extension)
+
+
+@overload
+def load_dataframe(
+    source: str | Path,
+    format: Optional[str] = None,
+    *,
+    chunksize: None = None,
+    cache: bool = False,
+    fast_io: bool = True,
+    **kwargs: Any,
+) -> pd.DataFrame: ...
+
+
+@overload
+def load_dataframe(
+    source: str | Path,
+    format: Optional[str] = None,
+    *,
+    chunksize: int,
+    cache: bool = False,
+    fast_io: bool = True,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]: ...
 
 
 def load_dataframe(
-    source: str | Path, format: Optional[str] = None, **kwargs: Any
-) -> pd.DataFrame:
+    source: str | Path,
+    format: Optional[str] = None,
+    *,
+    chunksize: Optional[int] = None,
+    cache: bool = False,
+    fast_io: bool = True,
+    **kwargs: Any,
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
     """Load a DataFrame from a file path.
 
     Args:
         source: Path to the data file.
         format: Force file format. Auto-detected from extension if None.
+        chunksize: If given, return an iterator of DataFrames with at most
+            this many rows each instead of loading the whole file.
+        cache: Reuse a previously parsed copy of an unchanged file from the
+            on-disk cache (see ``datawash.core.disk_cache``).
+        fast_io: Let adapters use their faster optional parsers (PyArrow for
+            CSV and Parquet, orjson for JSON). False forces the plain pandas
+            readers. Ignored for chunked reads.
         **kwargs: Passed to the adapter's read method.
 
     Returns:
-        Loaded DataFrame.
+        Loaded DataFrame, or an iterator of chunks when ``chunksize`` is set.
 
     Raises:
         AdapterError: If the file cannot be loaded.
@@ -48,19 +119,50 @@ def load_dataframe(
         raise AdapterError(f"File not found: {path}")
 
     ext = format or path.suffix.lstrip(".")
-    adapter = _ADAPTERS.get(ext)
-    if adapter is None:
+    _ensure_registered(ext)
+    reader = _READERS.get(ext)
+    if reader is None:
         raise AdapterError(
             f"Unsupported format: '{ext}'. "
-            f"Supported formats: {', '.join(sorted(_ADAPTERS.keys()))}"
+            f"Supported formats: {', '.join(sorted(_READERS.keys() | _LAZY.keys()))}"
+        )
+
+    if chunksize is not None:
+        read_chunks = _CHUNK_READERS.get(ext)
+        if read_chunks is None:
+            raise AdapterError(f"Chunked reading is not supported for '{ext}' files")
+        try:
+            logger.info("Streaming %s with %s adapter", path, ext)
+            chunks: Iterator[pd.DataFrame] = read_chunks(
+                path, chunksize=chunksize, **kwargs
+            )
+            return chunks
+        except AdapterError:
+            raise
+        except Exception as e:
+            raise AdapterError(f"Failed to read {path}: {e}") from e
+
+    cache_key = None
+    if cache:
+        from datawash import __version__
+
+        cache_key = disk_cache.file_fingerprint(
+            path, ext, sorted(kwargs.items()), fast_io, __version__
         )
+        cached = disk_cache.load_frame("frames", cache_key)
+        if cached is not None:
+            logger.info("Loaded %s from cache", path)
+            return cached
 
     try:
         logger.info("Loading %s with %s adapter", path, ext)
-        df = adapter.read(path, **kwargs)
+        df = reader(path, fast_io=fast_io, **kwargs)
         logger.info("Loaded %d rows, %d columns", len(df), len(df.columns))
-        return df
     except AdapterError:
         raise
     except Exception as e:
         raise AdapterError(f"Failed to read {path}: {e}") from e
+
+    if cache_key is not None:
+        disk_cache.store_frame("frames", cache_key, df)
+    return df
@@ -7,12 +7,13 @@ from typing import Any
 
 import pandas as pd
 
-from datawash.adapters.base import register_adapter
+from datawash.adapters.base import register_reader, register_writer
 from datawash.core.exceptions import AdapterError
 
 
 class ExcelAdapter:
-    def read(self, path: Path, **kwargs: Any) -> pd.DataFrame:
+    def read(self, path: Path, fast_io: bool = True, **kwargs: Any) -> pd.DataFrame:
+        # No alternative parser for Excel; fast_io has no effect
         try:
             return pd.read_excel(path, **kwargs)
         except ImportError:
@@ -32,5 +33,6 @@ class ExcelAdapter:
 
 
 _adapter = ExcelAdapter()
-register_adapter("xlsx", _adapter)
-register_adapter("xls", _adapter)
+for _ext in ("xlsx", "xls"):
+    register_reader(_ext, _adapter.read)
+    register_writer(_ext, _adapter.write)
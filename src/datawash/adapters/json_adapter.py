@@ -7,15 +7,91 @@ from typing import Any
 
 import pandas as pd
 
-from datawash.adapters.base import register_adapter
+from datawash.adapters.base import register_reader, register_writer
+
+try:
+    import orjson
+except ImportError:  # optional speedup; pandas handles everything without it
+    orjson = None  # type: ignore[assignment]
 
 
 class JsonAdapter:
-    def read(self, path: Path, **kwargs: Any) -> pd.DataFrame:
+    def read(self, path: Path, fast_io: bool = True, **kwargs: Any) -> pd.DataFrame:
+        if fast_io and orjson is not None and not kwargs:
+            data = path.read_bytes()
+            # Record arrays parse directly; values keep their JSON types
+            if data.lstrip()[:1] == b"[":
+                df = pd.DataFrame(orjson.loads(data))
+                if _matches_read_json(df):
+                    return df
         return pd.read_json(path, **kwargs)
 
     def write(self, df: pd.DataFrame, path: Path, **kwargs: Any) -> None:
+        if orjson is not None and not kwargs and not _has_temporal(df):
+            try:
+                payload = orjson.dumps(
+                    df.to_dict(orient="records"),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            except orjson.JSONEncodeError:
+                pass  # arbitrary objects in object columns; let pandas decide
+            else:
+                path.write_bytes(payload)
+                return
         df.to_json(path, orient="records", indent=2, **kwargs)
 
 
-register_adapter("json", JsonAdapter())
+def _matches_read_json(df: pd.DataFrame) -> bool:
+    """Whether ``pd.read_json`` would return ``df`` unchanged.
+
+    read_json parses date-named columns as datetimes, numeric text (labels
+    included) as numbers and integral floats as int64; frames with any such
+    column are left to pandas.
+    """
+    for name, col in df.items():
+        if _is_numeric_text(name) or _is_date_name(name) or col.dtype == object:
+            return False
+        if pd.api.types.is_string_dtype(col.dtype):
+            try:
+                col.astype("float64")
+            except (TypeError, ValueError):
+                continue
+            return False
+        if col.dtype.kind == "f" and len(col):
+            try:
+                integral = (col.astype("int64") == col).all()
+            except (TypeError, ValueError, OverflowError):
+                continue  # NaN or inf present; read_json keeps float64
+            if integral:
+                return False
+    return True
+
+
+def _is_numeric_text(name: object) -> bool:
+    try:
+        float(name)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _is_date_name(name: object) -> bool:
+    # read_json's keep_default_dates rule
+    if not isinstance(name, str):
+        return False
+    lower = name.lower()
+    return (
+        lower.endswith(("_at", "_time"))
+        or lower in {"modified", "date", "datetime"}
+        or lower.startswith("timestamp")
+    )
+
+
+def _has_temporal(df: pd.DataFrame) -> bool:
+    # pandas encodes datetimes as epoch milliseconds; orjson cannot encode them
+    return not df.select_dtypes(include=["datetime", "datetimetz", "timedelta"]).empty
+
+
+_adapter = JsonAdapter()
+register_reader("json", _adapter.read)
+register_writer("json", _adapter.write)
@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
-from datawash.adapters.base import register_adapter
+from datawash.adapters.base import (
+    register_chunk_reader,
+    register_reader,
+    register_writer,
+)
 from datawash.core.exceptions import AdapterError
 
 
 class ParquetAdapter:
-    def read(self, path: Path, **kwargs: Any) -> pd.DataFrame:
+    def read(self, path: Path, fast_io: bool = True, **kwargs: Any) -> pd.DataFrame:
+        if fast_io and set(kwargs) <= {"columns"}:
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                pass
+            else:
+                # Map the file instead of copying it into fresh buffers, and
+                # release Arrow columns as they are converted
+                table = pq.read_table(
+                    path,
+                    columns=kwargs.get("columns"),
+                    memory_map=True,
+                    use_threads=True,
+                )
+                return table.to_pandas(self_destruct=True, split_blocks=True)
         try:
             return pd.read_parquet(path, **kwargs)
         except ImportError:
@@ -21,6 +41,23 @@ class ParquetAdapter:
                 "Install with: pip install datawash[formats]"
             )
 
+    def read_chunks(
+        self, path: Path, chunksize: int = 500_000, **kwargs: Any
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the file as DataFrames of at most ``chunksize`` rows."""
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise AdapterError(
+                "Parquet support requires pyarrow. "
+                "Install with: pip install datawash[formats]"
+            )
+        parquet_file = pq.ParquetFile(path)
+        return (
+            batch.to_pandas()
+            for batch in parquet_file.iter_batches(batch_size=chunksize, **kwargs)
+        )
+
     def write(self, df: pd.DataFrame, path: Path, **kwargs: Any) -> None:
         try:
             df.to_parquet(path, index=False, **kwargs)
@@ -31,4 +68,7 @@ class ParquetAdapter:
             )
 
 
-register_adapter("parquet", ParquetAdapter())
+_adapter = ParquetAdapter()
+register_reader("parquet", _adapter.read)
+register_chunk_reader("parquet", _adapter.read_chunks)
+register_writer("parquet", _adapter.write)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -13,6 +15,9 @@ console = Console()
 
 SEVERITY_COLORS = {"high": "red", "medium": "yellow", "low": "green"}
 
+_finding_fields = attrgetter("severity.value", "detector", "message", "columns")
+_suggestion_fields = attrgetter("id", "priority.value", "action", "impact", "rationale")
+
 
 def format_profile(profile: DatasetProfile) -> None:
     """Print dataset profile."""
@@ -34,15 +39,19 @@ def format_profile(profile: DatasetProfile) -> None:
     table.add_column("Unique", justify="right")
     table.add_column("Sample Values")
 
-    for name, col in profile.columns.items():
-        null_str = (
-            f"{col.null_count} ({col.null_ratio:.0%})" if col.null_count > 0 else "0"
-        )
-        samples = ", ".join(str(v) for v in col.sample_values[:3])
-        semantic = f" [{col.semantic_type}]" if col.semantic_type else ""
-        table.add_row(
-            name, f"{col.dtype}{semantic}", null_str, str(col.unique_count), samples
+    rows = [
+        (
+            name,
+            f"{col.dtype} [{col.semantic_type}]" if col.semantic_type else col.dtype,
+            f"{col.null_count} ({col.null_ratio:.0%})" if col.null_count > 0 else "0",
+            str(col.unique_count),
+            ", ".join(map(str, col.sample_values[:3])),
         )
+        for name, col in profile.columns.items()
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
     console.print(table)
 
@@ -59,13 +68,13 @@ def format_issues(findings: list[Finding]) -> None:
     table.add_column("Message")
     table.add_column("Columns")
 
-    for f in findings:
-        color = SEVERITY_COLORS.get(f.severity.value, "white")
+    color_for = SEVERITY_COLORS.get
+    for sev, detector, message, columns in map(_finding_fields, findings):
         table.add_row(
-            Text(f.severity.value.upper(), style=color),
-            f.detector,
-            f.message,
-            ", ".join(f.columns),
+            Text(sev.upper(), style=color_for(sev, "white")),
+            detector,
+            message,
+            ", ".join(columns),
         )
 
     console.print(table)
@@ -84,14 +93,16 @@ def format_suggestions(suggestions: list[Suggestion]) -> None:
     table.add_column("Impact")
     table.add_column("Rationale")
 
-    for s in suggestions:
-        color = SEVERITY_COLORS.get(s.priority.value, "white")
+    color_for = SEVERITY_COLORS.get
+    for sid, priority, action, impact, rationale in map(
+        _suggestion_fields, suggestions
+    ):
         table.add_row(
-            str(s.id),
-            Text(s.priority.value.upper(), style=color),
-            s.action,
-            s.impact,
-            s.rationale,
+            str(sid),
+            Text(priority.upper(), style=color_for(priority, "white")),
+            action,
+            impact,
+            rationale,
         )
 
     console.print(table)
@@ -15,6 +15,8 @@ app = typer.Typer(
 )
 console = Console()
 
+_CACHE_HELP = "Reuse cached analysis results for unchanged files"
+
 
 @app.command()
 def analyze(
@@ -23,6 +25,12 @@ def analyze(
         None, "--sample", "-s", help="Number of rows to sample"
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
+    cache: bool = typer.Option(False, "--cache", help=_CACHE_HELP),
+    streaming: bool = typer.Option(
+        False,
+        "--streaming",
+        help="Profile in chunks with bounded memory (CSV/Parquet; profile only)",
+    ),
 ) -> None:
     """Analyze a dataset and show quality report."""
     from datawash.cli.formatters import (
@@ -32,8 +40,20 @@ def analyze(
     )
     from datawash.core.report import Report
 
+    if streaming:
+        from datawash.profiler.streaming import profile_file
+
+        with console.status("Profiling..."):
+            profile = profile_file(file)
+        format_profile(profile)
+        console.print(
+            "[dim]Streaming mode reports the profile only; "
+            "run without --streaming for issues and suggestions.[/]"
+        )
+        return
+
     with console.status("Analyzing..."):
-        report = Report(str(file))
+        report = Report(str(file), cache=cache)
 
     format_profile(report.profile)
     console.print()
@@ -52,17 +72,19 @@ def suggest(
         "all", "--priority", "-p", help="Filter: high, medium, low, all"
     ),
     limit: int = typer.Option(20, "--limit", "-l", help="Max suggestions"),
+    cache: bool = typer.Option(False, "--cache", help=_CACHE_HELP),
 ) -> None:
     """Show cleaning suggestions for a dataset."""
     from datawash.cli.formatters import format_suggestions
     from datawash.core.report import Report
 
     with console.status("Analyzing..."):
-        report = Report(str(file), use_case=use_case)
+        report = Report(str(file), use_case=use_case, cache=cache)
 
-    suggestions = report.suggestions
-    if priority != "all":
-        suggestions = [s for s in suggestions if s.priority.value == priority]
+    if priority == "all":
+        suggestions = report.suggestions
+    else:
+        suggestions = report.suggestions_by_priority(priority)
     suggestions = suggestions[:limit]
 
     format_suggestions(suggestions)
@@ -80,14 +102,15 @@ def clean(
     codegen: Optional[Path] = typer.Option(
         None, "--codegen", help="Also save generated Python code"
     ),
+    cache: bool = typer.Option(False, "--cache", help=_CACHE_HELP),
 ) -> None:
     """Clean a dataset by applying suggestions."""
-    from datawash.adapters.base import _ADAPTERS
+    from datawash.adapters.base import get_writer
     from datawash.cli.formatters import format_transformation_summary
     from datawash.core.report import Report
 
     with console.status("Analyzing..."):
-        report = Report(str(file), use_case=use_case)
+        report = Report(str(file), use_case=use_case, cache=cache)
 
     before_rows = len(report.df)
 
@@ -102,11 +125,11 @@ def clean(
 
     # Save output
     ext = output.suffix.lstrip(".")
-    adapter = _ADAPTERS.get(ext)
-    if adapter is None:
+    writer = get_writer(ext)
+    if writer is None:
         console.print(f"[red]Unsupported output format: {ext}[/]")
         raise typer.Exit(1)
-    adapter.write(clean_df, output)
+    writer(clean_df, output)
     console.print(f"Saved cleaned data to [bold]{output}[/]")
 
     format_transformation_summary(before_rows, len(clean_df), len(report._applied))
@@ -140,12 +163,13 @@ def codegen(
     output: Optional[Path] = typer.Option(
         None, "--output", "-o", help="Output Python file"
     ),
+    cache: bool = typer.Option(False, "--cache", help=_CACHE_HELP),
 ) -> None:
     """Generate Python code for data cleaning transformations."""
     from datawash.core.report import Report
 
     with console.status("Analyzing..."):
-        report = Report(str(file))
+        report = Report(str(file), cache=cache)
 
     if apply_all:
         report.apply_all()
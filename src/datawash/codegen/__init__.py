@@ -1 +1,2 @@
+from .generator import compile_function as compile_function
 from .generator import generate_code as generate_code
@@ -2,8 +2,27 @@
 
 from __future__ import annotations
 
+import io
+import re
+import textwrap
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
 from datawash.core.models import TransformationResult
 
+# Import lines (hoisted to the header) and blank lines in transformer code
+_DROPPED_LINES = re.compile(r"^(?:import .*|\s*)(?:\n|$)", re.MULTILINE)
+
+
+@lru_cache(maxsize=256)
+def _code_fragment(code: str, indent: str) -> str:
+    """A transformer's code without imports or blank lines, indented."""
+    body = _DROPPED_LINES.sub("", code).rstrip("\n")
+    if not body:
+        return ""
+    return textwrap.indent(body, indent) + "\n"
+
 
 def generate_code(
     results: list[TransformationResult],
@@ -23,50 +42,50 @@ def generate_code(
     if not results:
         return "# No transformations to apply"
 
-    lines: list[str] = []
+    out = io.StringIO()
+    write = out.write
 
     # Header
-    lines.append("import pandas as pd")
-    lines.append("import numpy as np")
-    lines.append("")
+    write("import pandas as pd\nimport numpy as np\n\n")
 
     if style == "function":
-        lines.append("")
-        lines.append("def clean_data(df: pd.DataFrame) -> pd.DataFrame:")
-        lines.append('    """Apply data cleaning transformations."""')
-        lines.append("    df = df.copy()")
-        lines.append("")
+        write(
+            "\ndef clean_data(df: pd.DataFrame) -> pd.DataFrame:\n"
+            '    """Apply data cleaning transformations."""\n'
+            "    df = df.copy()\n\n"
+        )
         for result in results:
             if include_comments:
-                lines.append(
-                    f"    # {result.transformer}: {result.rows_affected} rows affected"
+                write(
+                    f"    # {result.transformer}: {result.rows_affected} rows affected\n"
                 )
-            for code_line in result.code.split("\n"):
-                if code_line.strip():
-                    # Skip redundant imports inside function
-                    if code_line.startswith("import "):
-                        continue
-                    lines.append(f"    {code_line}")
-            lines.append("")
-        lines.append("    return df")
+            write(_code_fragment(result.code, "    "))
+            write("\n")
+        write("    return df\n")
     else:
         if include_comments:
-            lines.append("# Load data")
-        lines.append('df = pd.read_csv("input.csv")  # Update path as needed')
-        lines.append("")
+            write("# Load data\n")
+        write('df = pd.read_csv("input.csv")  # Update path as needed\n\n')
         for result in results:
             if include_comments:
-                lines.append(
-                    f"# {result.transformer}: {result.rows_affected} rows affected"
-                )
-            for code_line in result.code.split("\n"):
-                if code_line.strip():
-                    if code_line.startswith("import "):
-                        continue
-                    lines.append(code_line)
-            lines.append("")
+                write(f"# {result.transformer}: {result.rows_affected} rows affected\n")
+            write(_code_fragment(result.code, ""))
+            write("\n")
         if include_comments:
-            lines.append("# Save cleaned data")
-        lines.append('df.to_csv("output.csv", index=False)')
+            write("# Save cleaned data\n")
+        write('df.to_csv("output.csv", index=False)\n')
 
-    return "\n".join(lines) + "\n"
+    return out.getvalue()
+
+
+@lru_cache(maxsize=32)
+def compile_function(code: str) -> Callable[..., Any]:
+    """Compile ``style="function"`` output and return its ``clean_data``.
+
+    Compiled once per distinct source, so applying the same pipeline to
+    further frames skips the transformer registry entirely.
+    """
+    namespace: dict[str, Any] = {}
+    exec(compile(code, "<datawash>", "exec"), namespace)
+    fn: Callable[..., Any] = namespace["clean_data"]
+    return fn
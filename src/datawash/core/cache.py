@@ -4,29 +4,56 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from datawash.profiler.statistics import count_values
+
+# Columns whose null masks are computed together
+NULL_MASK_BLOCK = 256
+
 
 class ComputationCache:
     """Cache expensive column computations.
 
     Computes on first access, returns cached value on subsequent access.
     All detectors share the same cache instance to avoid redundant work.
+    Masks and intermediate values are kept as NumPy arrays.
     """
 
     def __init__(self, df: pd.DataFrame) -> None:
         self._df = df
-        self._null_masks: dict[str, pd.Series] = {}
+        self._null_masks: dict[str, np.ndarray] = {}
         self._value_sets: dict[str, set[str]] = {}
-        self._unique_counts: dict[str, int] = {}
+        self._value_counts: dict[str, pd.Series] = {}
         self._statistics: dict[str, dict[str, Any]] = {}
 
-    def get_null_mask(self, column: str) -> pd.Series:
-        """Return boolean mask of null values. Cached."""
+    def get_null_mask(self, column: str) -> np.ndarray:
+        """Return boolean array marking null values. Cached.
+
+        Masks are computed for up to ``NULL_MASK_BLOCK`` neighbouring columns
+        at once, so a frame's masks come from a few ``isna()`` calls.
+        """
         if column not in self._null_masks:
-            self._null_masks[column] = self._df[column].isna()
+            self._compute_null_masks(column)
         return self._null_masks[column]
 
+    def _compute_null_masks(self, column: str) -> None:
+        pos = self._df.columns.get_loc(column)
+        if not isinstance(pos, int):
+            # Duplicate names select several columns; mask the frame slice
+            self._null_masks[column] = self._df[column].isna().to_numpy()
+            return
+        start = pos - pos % NULL_MASK_BLOCK
+        block = self._df.iloc[:, start : start + NULL_MASK_BLOCK]
+        # One column per matrix column; the matrix is Fortran-ordered, so
+        # each slice is a contiguous view
+        matrix = block.isna().to_numpy()
+        shared = block.columns.duplicated(keep=False)
+        for i, name in enumerate(block.columns):
+            if not shared[i]:
+                self._null_masks.setdefault(name, matrix[:, i])
+
     def get_value_set(self, column: str, max_values: int = 10000) -> set[str]:
         """Return set of unique non-null string values. Cached."""
         if column not in self._value_sets:
@@ -36,11 +63,15 @@ class ComputationCache:
             self._value_sets[column] = set(values.astype(str))
         return self._value_sets[column]
 
+    def get_value_counts(self, column: str) -> pd.Series:
+        """Return non-null value frequencies, most common first. Cached."""
+        if column not in self._value_counts:
+            self._value_counts[column] = count_values(self._df[column])
+        return self._value_counts[column]
+
     def get_unique_count(self, column: str) -> int:
         """Return count of unique values. Cached."""
-        if column not in self._unique_counts:
-            self._unique_counts[column] = int(self._df[column].nunique())
-        return self._unique_counts[column]
+        return len(self.get_value_counts(column))
 
     def get_statistics(self, column: str) -> dict[str, Any]:
         """Return numeric statistics. Cached."""
@@ -51,13 +82,15 @@ class ComputationCache:
                 if clean.empty:
                     self._statistics[column] = {}
                 else:
+                    # Small int dtypes wrap around when quantiles interpolate
+                    q1, q3 = clean.astype("float64").quantile([0.25, 0.75])
                     self._statistics[column] = {
                         "mean": float(clean.mean()),
                         "std": float(clean.std()) if len(clean) > 1 else 0.0,
                         "min": float(clean.min()),
                         "max": float(clean.max()),
-                        "q1": float(clean.quantile(0.25)),
-                        "q3": float(clean.quantile(0.75)),
+                        "q1": float(q1),
+                        "q3": float(q3),
                     }
             else:
                 self._statistics[column] = {}
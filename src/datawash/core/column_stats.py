@@ -0,0 +1,159 @@
+"""Per-column string statistics shared by the detectors.
+
+The profiler computes these once per text column while it has the column's
+value counts in hand, so detectors read counts instead of re-scanning the
+data. Every statistic is evaluated on distinct values and weighted by their
+frequency, which gives the same result as a row-by-row pass.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # optional speedup for the whitespace checks
+    pa = None
+
+# Lowercased spellings that mark a column as boolean-as-string
+BOOL_STRINGS = frozenset(
+    {"true", "false", "yes", "no", "y", "n", "1", "0", "t", "f", "on", "off"}
+)
+
+DATE_PATTERNS: list[tuple[str, str]] = [
+    ("iso", r"^\d{4}-\d{2}-\d{2}"),
+    ("slash_mdy", r"^\d{1,2}/\d{1,2}/\d{2,4}$"),
+    ("dash_dmy", r"^\d{1,2}-[A-Za-z]{3}-\d{2,4}$"),
+    ("named_mdy", r"^[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4}$"),
+    ("named_dmy", r"^\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}$"),
+]
+
+# The patterns are mutually exclusive (they differ by the first character
+# after the leading digits), so one alternation classifies each value
+_DATE_FORMAT_NAMES = [name for name, _ in DATE_PATTERNS]
+_DATE_RE = re.compile("|".join(f"(?P<{name}>{p})" for name, p in DATE_PATTERNS))
+
+# Rows inspected when estimating how many values parse as numbers
+NUMERIC_SAMPLE_SIZE = 1000
+
+
+@dataclass(slots=True)
+class ColumnStats:
+    """String statistics for one column."""
+
+    non_null_count: int = 0
+    empty_count: int = 0
+    leading_whitespace: int = 0
+    trailing_whitespace: int = 0
+    has_upper: bool = False
+    has_lower: bool = False
+    has_title: bool = False
+    numeric_ratio: float = 0.0
+    boolean_values: list[str] = field(default_factory=list)
+    date_format_counts: dict[str, int] = field(default_factory=dict)
+
+
+def scan_column(
+    series: pd.Series, value_counts: Optional[pd.Series] = None
+) -> Optional[ColumnStats]:
+    """Compute :class:`ColumnStats` for a string column.
+
+    Args:
+        series: The column to scan.
+        value_counts: ``series.value_counts()`` if the caller already has it.
+
+    Returns:
+        The statistics, or None for non-string columns.
+    """
+    if not pd.api.types.is_string_dtype(series):
+        return None
+    if value_counts is None:
+        value_counts = series.value_counts()
+    counts = value_counts.to_numpy()
+    text = pd.Series(value_counts.index.astype(str), dtype=object)
+    stripped = text.str.strip()
+
+    def weighted(mask: pd.Series) -> int:
+        return int(counts[mask.to_numpy(dtype=bool)].sum())
+
+    values = text.to_numpy()
+    leading, trailing = _edge_whitespace(values)
+    lowered = set(stripped.str.lower())
+    date_format_counts = _date_format_counts(values, counts)
+
+    return ColumnStats(
+        non_null_count=int(counts.sum()),
+        empty_count=weighted(stripped == ""),
+        leading_whitespace=int(counts[leading].sum()),
+        trailing_whitespace=int(counts[trailing].sum()),
+        # Plain loops over the distinct values stop at the first hit
+        has_upper=any(v.isupper() for v in values),
+        has_lower=any(v.islower() for v in values),
+        has_title=any(v.istitle() for v in values),
+        numeric_ratio=_numeric_ratio(series),
+        boolean_values=sorted(lowered) if lowered <= BOOL_STRINGS else [],
+        date_format_counts=date_format_counts,
+    )
+
+
+def _edge_whitespace(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Masks of ``values`` whose first / last character is whitespace.
+
+    Arrow's ``utf8_is_space`` agrees with ``str.isspace`` on every code
+    point, so both paths give the same masks.
+    """
+    if pa is not None:
+        try:
+            arr = pa.array(values, type=pa.string())
+        except (pa.ArrowException, UnicodeEncodeError):
+            arr = None  # e.g. lone surrogates; use the Python loop
+        if arr is not None:
+            first = pc.utf8_slice_codeunits(arr, 0, 1)
+            last = pc.utf8_slice_codeunits(arr, -1, np.iinfo(np.int32).max)
+            return (
+                pc.utf8_is_space(first).to_numpy(zero_copy_only=False),
+                pc.utf8_is_space(last).to_numpy(zero_copy_only=False),
+            )
+    leading = np.fromiter(
+        (v[:1].isspace() for v in values), dtype=bool, count=len(values)
+    )
+    trailing = np.fromiter(
+        (v[-1:].isspace() for v in values), dtype=bool, count=len(values)
+    )
+    return leading, trailing
+
+
+def _date_format_counts(values: np.ndarray, counts: np.ndarray) -> dict[str, int]:
+    """Weighted count of values per matching ``DATE_PATTERNS`` entry."""
+    match = _DATE_RE.match
+    # Group n is the n-th pattern (the patterns have no groups of their own);
+    # 0 means no match
+    codes = np.fromiter(
+        ((m.lastindex or 0) if (m := match(v)) else 0 for v in values),
+        dtype=np.intp,
+        count=len(values),
+    )
+    totals = np.zeros(len(_DATE_FORMAT_NAMES) + 1, dtype=np.int64)
+    np.add.at(totals, codes, counts)
+    return {
+        name: int(total)
+        for name, total in zip(_DATE_FORMAT_NAMES, totals[1:])
+        if total > 0
+    }
+
+
+def _numeric_ratio(series: pd.Series) -> float:
+    """Fraction of non-null values that parse as numbers (sampled)."""
+    clean = series.dropna()
+    if clean.empty:
+        return 0.0
+    if len(clean) > NUMERIC_SAMPLE_SIZE:
+        clean = clean.sample(NUMERIC_SAMPLE_SIZE, random_state=42)
+    parsed = pd.to_numeric(clean, errors="coerce")
+    return float(np.count_nonzero(parsed.notna().to_numpy()) / len(clean))
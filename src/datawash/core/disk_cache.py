@@ -0,0 +1,169 @@
+"""Persistent on-disk cache for parsed files and analysis results.
+
+Entries are keyed by content fingerprints, so a changed input simply misses.
+The cache directory is size-bounded with least-recently-used eviction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHE_BYTES = 2 * 1024**3
+_EDGE_BYTES = 64 * 1024
+
+# Part of every frame key; bump when the key changes so that entries stored
+# under an older key can no longer be hit
+_FRAME_KEY_VERSION = 2
+
+
+def get_cache_dir() -> Path:
+    """Return the cache root (``$DATAWASH_CACHE_DIR`` or ``~/.cache/datawash``)."""
+    env = os.environ.get("DATAWASH_CACHE_DIR")
+    if env:
+        return Path(env)
+    return Path.home() / ".cache" / "datawash"
+
+
+def file_fingerprint(path: Path, *extra: Any) -> str:
+    """Hash a file's size, mtime and first/last 64 KiB plus ``extra`` values."""
+    stat = path.stat()
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{stat.st_size}:{stat.st_mtime_ns}:{extra!r}".encode())
+    with path.open("rb") as f:
+        h.update(f.read(_EDGE_BYTES))
+        if stat.st_size > _EDGE_BYTES:
+            f.seek(max(_EDGE_BYTES, stat.st_size - _EDGE_BYTES))
+            h.update(f.read(_EDGE_BYTES))
+    return h.hexdigest()
+
+
+def frame_fingerprint(df: pd.DataFrame, *extra: Any) -> str:
+    """Hash a DataFrame's values, columns and dtypes plus ``extra`` values.
+
+    ``hash_pandas_object`` hashes object values by their text, so ``1`` and
+    ``"1"`` look the same to it. Object columns therefore also contribute
+    their inferred type, and mixed columns the type of every value.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(
+        repr(
+            (_FRAME_KEY_VERSION, list(df.columns), [str(t) for t in df.dtypes], extra)
+        ).encode()
+    )
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    for i, dtype in enumerate(df.dtypes):
+        if not pd.api.types.is_object_dtype(dtype):
+            continue
+        values = df.iloc[:, i].to_numpy()
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+        h.update(f"{i}:{kind};".encode())
+        if kind.startswith("mixed"):
+            types = pd.Series([type(v).__name__ for v in values], dtype=object)
+            h.update(
+                pd.util.hash_pandas_object(types, index=False).to_numpy().tobytes()
+            )
+    return h.hexdigest()
+
+
+def key_fingerprint(*parts: Any) -> str:
+    """Hash plain values (strings, numbers, tuples) into a cache key."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=20).hexdigest()
+
+
+def _entry_path(namespace: str, key: str, suffix: str) -> Path:
+    return get_cache_dir() / namespace / f"{key}{suffix}"
+
+
+def _touch(path: Path) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def load_frame(namespace: str, key: str) -> Optional[pd.DataFrame]:
+    """Return a cached DataFrame, or None on a miss."""
+    path = _entry_path(namespace, key, ".feather")
+    if not path.exists():
+        return None
+    try:
+        df = pd.read_feather(path)
+    except Exception:
+        logger.debug("Discarding unreadable cache entry %s", path, exc_info=True)
+        path.unlink(missing_ok=True)
+        return None
+    _touch(path)
+    return df
+
+
+def store_frame(namespace: str, key: str, df: pd.DataFrame) -> None:
+    """Write a DataFrame to the cache. Failures are logged and ignored."""
+    path = _entry_path(namespace, key, ".feather")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_feather(path)
+    except Exception:
+        logger.debug("Could not cache DataFrame at %s", path, exc_info=True)
+        path.unlink(missing_ok=True)
+        return
+    evict()
+
+
+def load_object(namespace: str, key: str) -> Any:
+    """Return a cached pickled object, or None on a miss."""
+    path = _entry_path(namespace, key, ".pkl")
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as f:
+            obj = pickle.load(f)
+    except Exception:
+        logger.debug("Discarding unreadable cache entry %s", path, exc_info=True)
+        path.unlink(missing_ok=True)
+        return None
+    _touch(path)
+    return obj
+
+
+def store_object(namespace: str, key: str, obj: Any) -> None:
+    """Pickle an object into the cache. Failures are logged and ignored."""
+    path = _entry_path(namespace, key, ".pkl")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        logger.debug("Could not cache object at %s", path, exc_info=True)
+        path.unlink(missing_ok=True)
+        return
+    evict()
+
+
+def evict(max_bytes: int = MAX_CACHE_BYTES) -> None:
+    """Delete least-recently-used entries until the cache fits ``max_bytes``."""
+    root = get_cache_dir()
+    if not root.exists():
+        return
+    entries = []
+    total = 0
+    for path in root.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+    if total <= max_bytes:
+        return
+    for _mtime, size, path in sorted(entries):
+        path.unlink(missing_ok=True)
+        total -= size
+        if total <= max_bytes:
+            break
@@ -2,23 +2,103 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
+import numpy as np
 import pandas as pd
 
+_SIGNED_INTS = [np.dtype(t) for t in ("int8", "int16", "int32", "int64")]
+
+# Same tolerance pd.to_numeric(downcast="float") accepts for float32
+_FLOAT32_ATOL = 5e-4
+
 
-def optimize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+def optimize_dataframe(
+    df: pd.DataFrame, numeric_precision: Literal["f32", "f64"] = "f64"
+) -> pd.DataFrame:
     """Optimize DataFrame dtypes for faster analysis.
 
     Downcasts numeric types to reduce memory usage.
     Object/string columns are left unchanged to preserve detector compatibility.
+    Plain int64/float64 columns are sized from one min/max pass over the whole
+    numeric block and cast together; other numeric dtypes go through
+    ``pd.to_numeric``.
+
+    With ``numeric_precision="f32"`` float64 columns become float32 whenever
+    their values are within float32 range, even if that rounds them.
     """
-    df = df.copy()
+    if df.empty or df.columns.has_duplicates:
+        return _optimize_per_column(df.copy(), numeric_precision)
+
+    int_cols, float_cols, other_cols = [], [], []
+    for col, dtype in df.dtypes.items():
+        if dtype == np.int64:
+            int_cols.append(col)
+        elif dtype == np.float64:
+            float_cols.append(col)
+        elif pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype):
+            other_cols.append(col)
+
+    dtype_map: dict[object, np.dtype] = {}
+    if int_cols:
+        block = df[int_cols].to_numpy()
+        mins, maxs = block.min(axis=0), block.max(axis=0)
+        for col, lo, hi in zip(int_cols, mins, maxs):
+            dtype_map[col] = _smallest_int(lo, hi)
+    if float_cols:
+        block = df[float_cols].to_numpy()
+        # NaN and +/-inf survive the cast unchanged; everything else must be
+        # close. Out-of-range values overflow to inf and fail the check.
+        with np.errstate(over="ignore", invalid="ignore"):
+            narrowed = block.astype(np.float32)
+            if numeric_precision == "f32":
+                # Only values that would overflow to +/-inf rule a column out
+                fits = ~(np.isinf(narrowed) & np.isfinite(block)).any(axis=0)
+            else:
+                fits = (
+                    (np.abs(narrowed - block) <= _FLOAT32_ATOL)
+                    | (narrowed == block)
+                    | np.isnan(block)
+                ).all(axis=0)
+        for col, ok in zip(float_cols, fits):
+            if ok:
+                dtype_map[col] = np.dtype("float32")
+
+    dtype_map = {c: t for c, t in dtype_map.items() if t != df[c].dtype}
+    df = df.astype(dtype_map) if dtype_map else df.copy()
+    for col in other_cols:
+        df[col] = _downcast(df[col])
+    return df
+
+
+def _smallest_int(lo: int, hi: int) -> np.dtype:
+    for dtype in _SIGNED_INTS:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return dtype
+    return _SIGNED_INTS[-1]
+
 
-    for col in df.columns:
-        dtype = df[col].dtype
+def _downcast(
+    series: pd.Series, numeric_precision: Literal["f32", "f64"] = "f64"
+) -> pd.Series:
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return pd.to_numeric(series, downcast="integer")
+    if numeric_precision == "f32" and series.dtype == np.float64:
+        values = series.to_numpy()
+        with np.errstate(over="ignore"):
+            narrowed = values.astype(np.float32)
+        if not (np.isinf(narrowed) & np.isfinite(values)).any():
+            return series.astype(np.float32)
+    return pd.to_numeric(series, downcast="float")
 
-        if pd.api.types.is_integer_dtype(dtype):
-            df[col] = pd.to_numeric(df[col], downcast="integer")
-        elif pd.api.types.is_float_dtype(dtype):
-            df[col] = pd.to_numeric(df[col], downcast="float")
 
+def _optimize_per_column(
+    df: pd.DataFrame, numeric_precision: Literal["f32", "f64"] = "f64"
+) -> pd.DataFrame:
+    # Label-based assignment is ambiguous with duplicate names; go by position.
+    # Empty frames land here too, since min/max of an empty block is undefined.
+    for i, dtype in enumerate(df.dtypes):
+        if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype):
+            df.isetitem(i, _downcast(df.iloc[:, i], numeric_precision))
     return df
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import enum
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from datawash.core.column_stats import ColumnStats
 
 
 class Severity(str, enum.Enum):
@@ -14,8 +15,12 @@ class Severity(str, enum.Enum):
     LOW = "low"
 
 
-class ColumnProfile(BaseModel):
-    """Profile for a single column."""
+@dataclass(slots=True)
+class ColumnProfile:
+    """Profile for a single column.
+
+    Not frozen: type detection fills in ``semantic_type``.
+    """
 
     name: str
     dtype: str
@@ -24,55 +29,64 @@ class ColumnProfile(BaseModel):
     null_ratio: float = 0.0
     unique_count: int = 0
     unique_ratio: float = 0.0
-    sample_values: list[Any] = Field(default_factory=list)
-    statistics: dict[str, Any] = Field(default_factory=dict)
-    patterns: dict[str, Any] = Field(default_factory=dict)
+    sample_values: list[Any] = field(default_factory=list)
+    statistics: dict[str, Any] = field(default_factory=dict)
+    patterns: dict[str, Any] = field(default_factory=dict)
+    text_stats: Optional[ColumnStats] = None
 
 
-class DatasetProfile(BaseModel):
+@dataclass(slots=True)
+class DatasetProfile:
     """Profile for an entire dataset."""
 
     row_count: int
     column_count: int
     memory_bytes: int
-    columns: dict[str, ColumnProfile] = Field(default_factory=dict)
+    columns: dict[str, ColumnProfile] = field(default_factory=dict)
     duplicate_row_count: int = 0
+    duplicate_rows: list[Any] = field(default_factory=list)
     sampled: bool = False
     sample_size: Optional[int] = None
 
 
-class Finding(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Finding:
     """A detected data quality issue."""
 
     detector: str
     issue_type: str
     severity: Severity
-    columns: list[str] = Field(default_factory=list)
-    rows: Optional[list[int]] = None
-    details: dict[str, Any] = Field(default_factory=dict)
     message: str
+    columns: list[str] = field(default_factory=list)
+    rows: Optional[list[int]] = None
+    details: dict[str, Any] = field(default_factory=dict)
     confidence: float = 1.0
 
 
-class Suggestion(BaseModel):
-    """A suggested fix for a finding."""
+@dataclass(slots=True)
+class Suggestion:
+    """A suggested fix for a finding.
+
+    Not frozen: the prioritizer renumbers ``id`` after sorting.
+    """
 
     id: int
     finding: Finding
     action: str
     transformer: str
-    params: dict[str, Any] = Field(default_factory=dict)
     priority: Severity
     impact: str
     rationale: str
+    params: dict[str, Any] = field(default_factory=dict)
     preview: Optional[str] = None
 
 
-class TransformationResult(BaseModel):
+@dataclass(slots=True)
+class TransformationResult:
     """Result of applying a transformation."""
 
     transformer: str
-    params: dict[str, Any] = Field(default_factory=dict)
     rows_affected: int
-    columns_affected: list[str] = Field(default_factory=list)
+    params: dict[str, Any] = field(default_factory=dict)
+    columns_affected: list[str] = field(default_factory=list)
     code: str = ""
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import copy
 import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
 import pandas as pd
-from rich.console import Console
-from rich.table import Table
 
 from datawash.adapters import load_dataframe
-from datawash.codegen import generate_code as _generate_code
+from datawash.core import disk_cache
 from datawash.core.cache import ComputationCache
 from datawash.core.config import Config
 from datawash.core.dtypes import optimize_dataframe
@@ -22,22 +25,79 @@ from datawash.core.models import (
     Suggestion,
     TransformationResult,
 )
-from datawash.core.sampling import SmartSampler
 from datawash.detectors import run_all_detectors
-from datawash.detectors.registry import get_all_detectors
+from datawash.detectors.registry import get_all_detectors, run_detectors
 from datawash.profiler import profile_dataset
-from datawash.profiler.parallel import (
-    profile_dataset_parallel,
-    run_detectors_parallel,
-)
+from datawash.profiler.statistics import count_duplicates
 from datawash.suggestors import generate_suggestions
 from datawash.suggestors.engine import _sort_by_execution_order
 from datawash.transformers import run_transformer
+from datawash.transformers.base import copy_frame
+
+# Sampling, the parallel engine, Rich and codegen are imported where they are
+# used, so scripts that only read a report's findings don't load them
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from datawash.core.sampling import SmartSampler
 
 logger = logging.getLogger(__name__)
 
-# Threshold below which parallel overhead isn't worth it
-_PARALLEL_THRESHOLD = 5000
+# Rows from which analysis runs on a SmartSampler sample
+_SAMPLE_ROWS = 50_000
+
+# Cells (rows x columns) below which parallel overhead isn't worth it
+_PARALLEL_THRESHOLD = 200_000
+
+_SEVERITY_PENALTIES = {Severity.HIGH: 10.0, Severity.MEDIUM: 5.0}
+_DEFAULT_PENALTY = 2.0
+
+_PRIORITY_COLORS = {"high": "red", "medium": "orange", "low": "green"}
+_SUGGESTION_TABLE_HEAD = (
+    "<table border='1' style='border-collapse: collapse;'>\n"
+    "<tr><th>#</th><th>Priority</th><th>Action</th><th>Impact</th></tr>\n"
+)
+
+# Detectors whose findings depend only on the columns they name. After an
+# apply() their findings for untouched columns are reused; the rest re-run.
+_COLUMN_LOCAL_DETECTORS = frozenset({"missing", "types", "formats", "outliers"})
+
+# Analyses of recently seen data, keyed like the on-disk "reports" cache, so
+# building several Reports over the same frame in one session analyzes it once.
+# Entries are private copies; each Report gets copies of its own.
+_ANALYSIS_MEMO_SIZE = 16
+_ANALYSIS_MEMO: OrderedDict[
+    str, tuple[DatasetProfile, list[Finding], list[Suggestion]]
+] = OrderedDict()
+
+
+def _finding_penalties(findings: list[Finding]) -> np.ndarray:
+    """Confidence-weighted score penalty of each finding."""
+    return np.fromiter(
+        (
+            _SEVERITY_PENALTIES.get(f.severity, _DEFAULT_PENALTY) * f.confidence
+            for f in findings
+        ),
+        dtype=np.float64,
+        count=len(findings),
+    )
+
+
+def _score_from_findings(findings: list[Finding], row_count: int) -> int:
+    """Quality score from 0 to 100; empty data scores 100."""
+    if row_count == 0:
+        return 100
+    penalty = _finding_penalties(findings).sum()
+    return max(0, min(100, int(100.0 - penalty)))
+
+
+def _remember_analysis(
+    key: str, analysis: tuple[DatasetProfile, list[Finding], list[Suggestion]]
+) -> None:
+    _ANALYSIS_MEMO[key] = copy.deepcopy(analysis)
+    _ANALYSIS_MEMO.move_to_end(key)
+    while len(_ANALYSIS_MEMO) > _ANALYSIS_MEMO_SIZE:
+        _ANALYSIS_MEMO.popitem(last=False)
 
 
 class Report:
@@ -49,6 +109,10 @@ class Report:
         use_case: Context for suggestion prioritization.
         sample: Enable smart sampling for large datasets (default True).
         parallel: Enable parallel profiling and detection (default True).
+        cache: Reuse parsing and analysis results for unchanged inputs from
+            the on-disk cache (default False). Analyses of the last few
+            frames are also kept in memory for the session, except for
+            sampled frames when ``cache`` is False.
     """
 
     def __init__(
@@ -58,7 +122,9 @@ class Report:
         use_case: str = "general",
         sample: bool = True,
         parallel: bool = True,
+        cache: bool = False,
     ) -> None:
+        self._parallel = parallel
         # Resolve config
         if config is None:
             self._config = Config(use_case=use_case)
@@ -67,52 +133,143 @@ class Report:
             self._config = Config.from_dict(config)
         else:
             self._config = config
+        enabled = self._config.detectors.enabled
+        enabled_set = None if enabled is None else frozenset(enabled)
+        self._active_detectors = {
+            n: d
+            for n, d in get_all_detectors().items()
+            if enabled_set is None or n in enabled_set
+        }
 
         # Load data
         if isinstance(data, (str, Path)):
-            self._df = load_dataframe(data)
+            self._df = load_dataframe(data, cache=cache, fast_io=self._config.fast_io)
             self._source_path = str(data)
         else:
-            self._df = data
+            # A new frame object over the same data: no copying, and with
+            # Copy-on-Write the caller's later edits no longer reach the report
+            self._df = data.copy(deep=False)
             self._source_path = None
 
+        self._sampler: SmartSampler | None = None
+        # Hashing every row costs about as much as analyzing a sample, so
+        # without the disk cache sampled frames skip the in-memory memo
+        analysis_key = None
+        if cache or not (sample and len(self._df) >= _SAMPLE_ROWS):
+            analysis_key = self._analysis_cache_key(sample)
+        cached: Optional[tuple[DatasetProfile, list[Finding], list[Suggestion]]]
+        cached = None
+        from_disk = from_memo = False
+        if cache and analysis_key is not None:
+            cached = disk_cache.load_object("reports", analysis_key)
+            from_disk = cached is not None
+        if (
+            cached is None
+            and analysis_key is not None
+            and analysis_key in _ANALYSIS_MEMO
+        ):
+            _ANALYSIS_MEMO.move_to_end(analysis_key)
+            cached = copy.deepcopy(_ANALYSIS_MEMO[analysis_key])
+            from_memo = True
+
+        if cached is not None:
+            logger.info("Reusing cached analysis")
+            self._profile, self._findings, suggestions = cached
+            self._suggestion_map = {s.id: s for s in suggestions}
+        else:
+            self._analyze(sample, parallel)
+        if analysis_key is not None:
+            analysis = (self._profile, self._findings, self.suggestions)
+            if not from_memo:
+                _remember_analysis(analysis_key, analysis)
+            if cache and not from_disk:
+                disk_cache.store_object("reports", analysis_key, analysis)
+        self._cache_key = analysis_key if cache else None
+        self._suggestions_by_priority: dict[str, list[Suggestion]] = {
+            p.value: [] for p in Severity
+        }
+        for s in self._suggestion_map.values():
+            self._suggestions_by_priority[s.priority.value].append(s)
+        self._findings_by_severity: dict[Severity, list[Finding]] = {
+            sev: [] for sev in Severity
+        }
+        for f in self._findings:
+            self._findings_by_severity[f.severity].append(f)
+        # Suggestions are fixed from here on; apply paths walk this order
+        self._sorted_suggestions = _sort_by_execution_order(self.suggestions)
+        self._quality_score = _score_from_findings(
+            self._findings, self._profile.row_count
+        )
+        self._applied: list[TransformationResult] = []
+        # Scores around the most recent apply; nothing applied yet
+        self._last_score_before: int = self._quality_score
+        self._last_score_after: int = self._quality_score
+        # Generated code per style for the current _applied log
+        self._code_cache: dict[str, str] = {}
+        # Last apply(): (sorted suggestion IDs, (clean df, applied log, score
+        # before, score after)). Only one cleaned frame is ever held.
+        self._last_apply: Optional[
+            tuple[
+                tuple[int, ...],
+                tuple[pd.DataFrame, list[TransformationResult], int, int],
+            ]
+        ] = None
+
+    def _analysis_cache_key(self, sample: bool) -> Optional[str]:
+        """Fingerprint the data and every setting that affects analysis."""
+        from datawash import __version__
+
+        try:
+            return disk_cache.frame_fingerprint(
+                self._df, self._config.model_dump_json(), sample, __version__
+            )
+        except TypeError:
+            # Unhashable cell values (lists, dicts) - skip caching
+            logger.debug("Analysis cache disabled for this frame", exc_info=True)
+            return None
+
+    def _analyze(self, sample: bool, parallel: bool) -> None:
+        """Profile the data, run detectors and generate suggestions."""
+        # Smart sampling for large datasets, before anything else touches
+        # every row
+        raw_df = self._df
+        if sample and len(raw_df) >= _SAMPLE_ROWS:
+            from datawash.core.sampling import SmartSampler
+
+            self._sampler = SmartSampler(raw_df)
+            raw_df = self._sampler.sample_df
+
         # Optimize dtypes for faster analysis
         try:
-            optimized_df = optimize_dataframe(self._df)
+            analysis_df = optimize_dataframe(
+                raw_df, numeric_precision=self._config.numeric_precision
+            )
         except Exception:
             logger.debug("Dtype optimization skipped", exc_info=True)
-            optimized_df = self._df
-
-        # Smart sampling for large datasets
-        self._sampler: SmartSampler | None = None
-        if sample and len(optimized_df) >= 50_000:
-            self._sampler = SmartSampler(optimized_df)
-            analysis_df = self._sampler.sample_df
-        else:
-            analysis_df = optimized_df
+            analysis_df = raw_df
 
         # Decide whether to use parallel execution
-        use_parallel = parallel and (
-            len(analysis_df) > _PARALLEL_THRESHOLD or len(analysis_df.columns) > 20
-        )
+        use_parallel = parallel and analysis_df.size > _PARALLEL_THRESHOLD
 
         # Profile and detect
         if use_parallel:
+            from datawash.profiler.parallel import (
+                profile_dataset_parallel,
+                run_detectors_parallel,
+            )
+
             cache = ComputationCache(analysis_df)
             self._profile = profile_dataset_parallel(analysis_df, cache=cache)
-            active = {
-                n: d
-                for n, d in get_all_detectors().items()
-                if self._config.detectors.enabled is None
-                or n in self._config.detectors.enabled
-            }
-            self._findings = run_detectors_parallel(analysis_df, self._profile, active)
+            self._findings = run_detectors_parallel(
+                analysis_df, self._profile, self._active_detectors
+            )
         else:
             self._profile = profile_dataset(analysis_df)
             self._findings = run_all_detectors(
                 analysis_df,
                 self._profile,
                 enabled=self._config.detectors.enabled,
+                parallel=parallel,
             )
 
         # Restore original row/column counts in profile when sampled
@@ -120,26 +277,27 @@ class Report:
             self._profile = DatasetProfile(
                 row_count=len(self._df),
                 column_count=len(self._df.columns),
-                memory_bytes=int(self._df.memory_usage(deep=True).sum()),
+                memory_bytes=self._sampler.extrapolate_memory(self._df),
                 columns=self._profile.columns,
                 duplicate_row_count=self._sampler.extrapolate_count(
                     self._profile.duplicate_row_count
                 ),
+                duplicate_rows=self._profile.duplicate_rows,
                 sampled=True,
                 sample_size=len(self._sampler.sample_df),
             )
 
-        self._suggestions = generate_suggestions(
+        suggestions = generate_suggestions(
             self._findings,
             max_suggestions=self._config.suggestions.max_suggestions,
             use_case=self._config.use_case,
         )
-        self._applied: list[TransformationResult] = []
+        self._suggestion_map = {s.id: s for s in suggestions}
 
     @property
     def df(self) -> pd.DataFrame:
-        """The original DataFrame (read-only copy)."""
-        return self._df.copy()
+        """The original DataFrame (a copy; changes do not affect the report)."""
+        return copy_frame(self._df)
 
     @property
     def profile(self) -> DatasetProfile:
@@ -154,70 +312,147 @@ class Report:
     @property
     def suggestions(self) -> list[Suggestion]:
         """Prioritized list of suggestions."""
-        return list(self._suggestions)
+        return list(self._suggestion_map.values())
 
     @property
     def quality_score(self) -> int:
         """Data quality score from 0 to 100."""
-        score = 100.0
-        if self._profile.row_count == 0:
-            return 100
-        for finding in self._findings:
-            if finding.severity == Severity.HIGH:
-                penalty = 10.0
-            elif finding.severity == Severity.MEDIUM:
-                penalty = 5.0
-            else:
-                penalty = 2.0
-            # Scale by confidence
-            penalty *= finding.confidence
-            score -= penalty
-        return max(0, min(100, int(score)))
+        return self._quality_score
+
+    def suggestions_by_priority(self, priority: str) -> list[Suggestion]:
+        """Suggestions of one priority ("high", "medium" or "low")."""
+        return list(self._suggestions_by_priority.get(priority, []))
 
     def suggest(self, use_case: Optional[str] = None) -> list[Suggestion]:
         """Get filtered suggestions, optionally for a specific use case."""
         # For now, return all suggestions. Use-case filtering is Phase 2.
-        return list(self._suggestions)
+        return self.suggestions
 
     def _compute_quality_score(self, df: pd.DataFrame) -> int:
-        """Compute quality score for an arbitrary DataFrame."""
-        from datawash.detectors import run_all_detectors as _detect
-        from datawash.profiler import profile_dataset as _profile
-
-        prof = _profile(df)
-        findings = _detect(df, prof, enabled=self._config.detectors.enabled)
-        score = 100.0
-        if prof.row_count == 0:
-            return 100
-        for f in findings:
-            if f.severity == Severity.HIGH:
-                penalty = 10.0
-            elif f.severity == Severity.MEDIUM:
-                penalty = 5.0
-            else:
-                penalty = 2.0
-            penalty *= f.confidence
-            score -= penalty
-        return max(0, min(100, int(score)))
+        """Compute quality score for an arbitrary DataFrame.
+
+        When ``df`` is the report's data with only some columns rewritten by
+        the applied transformations, just those columns are re-profiled and
+        re-checked; see :meth:`_rescore_touched`.
+        """
+        touched = self._touched_columns(df)
+        if touched is not None:
+            return self._rescore_touched(df, touched)
+        prof = profile_dataset(df)
+        active = self._active_detectors
+        findings = run_detectors(df, prof, active, self._max_workers(active))
+        return _score_from_findings(findings, prof.row_count)
+
+    def _max_workers(self, detectors: dict[str, Any]) -> int:
+        """Threads for re-running ``detectors``; one unless parallel is on."""
+        return len(detectors) if self._parallel else 1
+
+    def _touched_columns(self, df: pd.DataFrame) -> Optional[list[str]]:
+        """Columns the applied transformations changed, or None if unknown.
+
+        None whenever the original findings can't be reused: the analysis was
+        sampled, or rows or columns were added, dropped, renamed or reordered.
+        """
+        if self._profile.sampled:
+            return None
+        if len(df) != len(self._df) or not df.columns.equals(self._df.columns):
+            return None
+        if df.columns.has_duplicates or not set(df.columns) <= set(
+            self._profile.columns
+        ):
+            return None
+        touched = {c for r in self._applied for c in r.columns_affected}
+        return [c for c in df.columns if c in touched]
+
+    def _rescore_touched(self, df: pd.DataFrame, touched: list[str]) -> int:
+        """Score ``df`` reusing findings for the columns it left unchanged."""
+        active = self._active_detectors
+        touched_set = set(touched)
+        findings = [
+            f
+            for f in self._findings
+            if f.detector in _COLUMN_LOCAL_DETECTORS
+            and f.detector in active
+            and touched_set.isdisjoint(f.columns)
+        ]
+        local = {n: d for n, d in active.items() if n in _COLUMN_LOCAL_DETECTORS}
+        whole_frame = {n: d for n, d in active.items() if n not in local}
+
+        columns = {c: self._profile.columns[c] for c in df.columns}
+        if touched:
+            touched_profile = profile_dataset(df[touched])
+            columns.update(touched_profile.columns)
+            if local:
+                findings += run_detectors(
+                    df[touched], touched_profile, local, self._max_workers(local)
+                )
+        if whole_frame:
+            duplicate_count, duplicate_rows = count_duplicates(df)
+            prof = DatasetProfile(
+                row_count=len(df),
+                column_count=len(df.columns),
+                memory_bytes=self._profile.memory_bytes,
+                columns=columns,
+                duplicate_row_count=duplicate_count,
+                duplicate_rows=duplicate_rows,
+            )
+            findings += run_detectors(
+                df, prof, whole_frame, self._max_workers(whole_frame)
+            )
+        return _score_from_findings(findings, len(df))
 
     def apply(self, suggestion_ids: list[int]) -> pd.DataFrame:
-        """Apply selected suggestions by ID, return cleaned DataFrame."""
+        """Apply selected suggestions by ID, return cleaned DataFrame.
+
+        The most recent result is kept, so re-applying the same set of IDs
+        returns a copy of it; a different selection releases it first. With
+        ``cache=True`` results are also kept in the on-disk cache.
+        """
+        memo_key = tuple(sorted(suggestion_ids))
+        entry = None
+        if self._last_apply is not None and self._last_apply[0] == memo_key:
+            entry = self._last_apply[1]
+        self._last_apply = None  # never hold two cleaned frames at once
+        disk_key = None
+        if entry is None and self._cache_key is not None:
+            disk_key = disk_cache.key_fingerprint(self._cache_key, memo_key)
+            entry = disk_cache.load_object("apply", disk_key)
+        if entry is None:
+            result_df = self._apply(suggestion_ids)
+            entry = (
+                result_df,
+                self._applied,
+                self._last_score_before,
+                self._last_score_after,
+            )
+            if disk_key is not None:
+                disk_cache.store_object("apply", disk_key, entry)
+        else:
+            logger.info("Reusing result for suggestions %s", list(memo_key))
+            (
+                result_df,
+                applied,
+                self._last_score_before,
+                self._last_score_after,
+            ) = entry
+            self._applied = list(applied)
+            self._code_cache.clear()
+
+        self._last_apply = (memo_key, entry)
+        return copy_frame(result_df)
+
+    def _apply(self, suggestion_ids: list[int]) -> pd.DataFrame:
         score_before = self.quality_score
-        result_df = self._df.copy()
-        id_map = {s.id: s for s in self._suggestions}
+        # Transformers return new frames, so the original is never modified
+        result_df = self._df
         self._applied = []
+        self._code_cache.clear()
 
-        # Collect and sort suggestions by execution order
-        suggestions_to_apply = []
-        for sid in suggestion_ids:
-            suggestion = id_map.get(sid)
-            if suggestion is None:
-                logger.warning("Suggestion ID %d not found, skipping", sid)
-                continue
-            suggestions_to_apply.append(suggestion)
-
-        # Sort by transformation execution order to prevent conflicts
-        suggestions_to_apply = _sort_by_execution_order(suggestions_to_apply)
+        wanted = set(suggestion_ids)
+        for sid in sorted(wanted - self._suggestion_map.keys()):
+            logger.warning("Suggestion ID %d not found, skipping", sid)
+        # Keep execution order to prevent conflicts
+        suggestions_to_apply = [s for s in self._sorted_suggestions if s.id in wanted]
 
         for suggestion in suggestions_to_apply:
             result_df, tx_result = run_transformer(
@@ -243,7 +478,7 @@ class Report:
 
     def apply_all(self) -> pd.DataFrame:
         """Apply all suggestions and return cleaned DataFrame."""
-        return self.apply([s.id for s in self._suggestions])
+        return self.apply(list(self._suggestion_map))
 
     def apply_interactive(
         self, input_fn: Any = None, console: Optional[Console] = None
@@ -255,18 +490,22 @@ class Report:
                       Useful for testing with monkeypatch.
             console: Optional Rich Console for output.
         """
+        from rich.console import Console
+        from rich.table import Table
+
         if input_fn is None:
             input_fn = input
         if console is None:
             console = Console()
 
         score_before = self.quality_score
-        result_df = self._df.copy()
+        result_df = self._df
         self._applied = []
+        self._code_cache.clear()
         apply_all = False
 
         # Sort suggestions by execution order to prevent conflicts
-        sorted_suggestions = _sort_by_execution_order(list(self._suggestions))
+        sorted_suggestions = self._sorted_suggestions
 
         for suggestion in sorted_suggestions:
             if not apply_all:
@@ -321,7 +560,7 @@ class Report:
         console.print(msg)
         self._last_score_before = score_before
         self._last_score_after = score_after
-        return result_df
+        return result_df if result_df is not self._df else copy_frame(result_df)
 
     def generate_code(self, style: str = "function") -> str:
         """Generate Python code for applied transformations.
@@ -331,11 +570,34 @@ class Report:
         if not self._applied:
             # Auto-apply all if nothing applied yet
             self.apply_all()
-        return _generate_code(
-            self._applied,
-            style=style,
-            include_comments=self._config.codegen.include_comments,
-        )
+        code = self._code_cache.get(style)
+        if code is None:
+            from datawash.codegen import generate_code as _generate_code
+
+            code = _generate_code(
+                self._applied,
+                style=style,
+                include_comments=self._config.codegen.include_comments,
+            )
+            self._code_cache[style] = code
+        return code
+
+    def compile_pipeline(self) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """Return the applied transformations as one compiled function.
+
+        The function is built from ``generate_code(style="function")``, so it
+        takes a DataFrame and returns a cleaned copy. Use it to clean further
+        frames with the same schema, e.g. validation and test splits. Applies
+        all suggestions first if nothing has been applied yet; with no
+        suggestions at all the function just returns a copy.
+        """
+        from datawash.codegen import compile_function
+
+        code = self.generate_code(style="function")
+        if not self._applied:
+            return copy_frame  # no clean_data() is generated for an empty log
+        fn: Callable[[pd.DataFrame], pd.DataFrame] = compile_function(code)
+        return fn
 
     def summary(self) -> str:
         """Human-readable analysis summary."""
@@ -346,15 +608,14 @@ class Report:
             f"Duplicate rows: {self._profile.duplicate_row_count}",
             f"Data Quality Score: {self.quality_score}/100",
             f"Issues found: {len(self._findings)}",
-            f"Suggestions: {len(self._suggestions)}",
+            f"Suggestions: {len(self._suggestion_map)}",
             "",
         ]
 
         # Group issues by severity
-        for severity in ["high", "medium", "low"]:
-            issues = [f for f in self._findings if f.severity.value == severity]
+        for severity, issues in self._findings_by_severity.items():
             if issues:
-                lines.append(f"  [{severity.upper()}] {len(issues)} issue(s)")
+                lines.append(f"  [{severity.value.upper()}] {len(issues)} issue(s)")
                 for issue in issues[:5]:
                     lines.append(f"    - {issue.message}")
                 if len(issues) > 5:
@@ -367,41 +628,32 @@ class Report:
             f"Report(rows={self._profile.row_count}, "
             f"cols={self._profile.column_count}, "
             f"issues={len(self._findings)}, "
-            f"suggestions={len(self._suggestions)})"
+            f"suggestions={len(self._suggestion_map)})"
         )
 
     def _repr_html_(self) -> str:
         """Rich display for Jupyter notebooks."""
-        html = [
-            "<div style='font-family: monospace;'>",
-            "<h3>DataWash Report</h3>",
+        html = (
+            "<div style='font-family: monospace;'>\n<h3>DataWash Report</h3>\n"
             f"<p><b>Dataset:</b> {self._profile.row_count} rows "
-            f"x {self._profile.column_count} columns</p>",
+            f"x {self._profile.column_count} columns</p>\n"
             f"<p><b>Issues:</b> {len(self._findings)} | "
-            f"<b>Suggestions:</b> {len(self._suggestions)}</p>",
-        ]
-        if self._suggestions:
-            html.append("<table border='1' style='border-collapse: collapse;'>")
-            html.append(
-                "<tr><th>#</th><th>Priority</th><th>Action</th><th>Impact</th></tr>"
+            f"<b>Suggestions:</b> {len(self._suggestion_map)}</p>\n"
+        )
+        if self._suggestion_map:
+            rows = "\n".join(
+                f"<tr><td>{s.id}</td>"
+                f"<td style='color:{_PRIORITY_COLORS.get(s.priority.value, 'gray')};'>"
+                f"{s.priority.value}</td>"
+                f"<td>{s.action}</td>"
+                f"<td>{s.impact}</td></tr>"
+                for s in islice(self._suggestion_map.values(), 10)
             )
-            for s in self._suggestions[:10]:
-                color = {"high": "red", "medium": "orange", "low": "green"}.get(
-                    s.priority.value, "gray"
-                )
-                html.append(
-                    f"<tr><td>{s.id}</td>"
-                    f"<td style='color:{color};'>{s.priority.value}</td>"
-                    f"<td>{s.action}</td>"
-                    f"<td>{s.impact}</td></tr>"
-                )
-            if len(self._suggestions) > 10:
-                html.append(
-                    f"<tr><td colspan='4'>... and {len(self._suggestions) - 10} more</td></tr>"
-                )
-            html.append("</table>")
-        html.append("</div>")
-        return "\n".join(html)
+            more = len(self._suggestion_map) - 10
+            if more > 0:
+                rows += f"\n<tr><td colspan='4'>... and {more} more</td></tr>"
+            html += f"{_SUGGESTION_TABLE_HEAD}{rows}\n</table>\n"
+        return html + "</div>"
 
 
 def analyze(
@@ -410,6 +662,7 @@ def analyze(
     use_case: str = "general",
     sample: bool = True,
     parallel: bool = True,
+    cache: bool = False,
 ) -> Report:
     """Analyze a dataset and return a Report.
 
@@ -421,10 +674,16 @@ def analyze(
         use_case: One of "general", "ml", "analytics", "export".
         sample: Enable smart sampling for large datasets.
         parallel: Enable parallel profiling and detection.
+        cache: Reuse results for unchanged inputs from the on-disk cache.
 
     Returns:
         A Report object with issues, suggestions, and cleaning methods.
     """
     return Report(
-        data, config=config, use_case=use_case, sample=sample, parallel=parallel
+        data,
+        config=config,
+        use_case=use_case,
+        sample=sample,
+        parallel=parallel,
+        cache=cache,
     )
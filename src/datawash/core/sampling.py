@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+import numpy as np
 import pandas as pd
 
 SAMPLE_THRESHOLD = 50_000
 SAMPLE_SIZE = 10_000
 
+# Leading rows checked before counting a candidate column's distinct values
+CARDINALITY_PROBE_ROWS = 2048
+
 
 class SmartSampler:
     """Intelligent sampling for large datasets.
@@ -25,60 +31,131 @@ class SmartSampler:
         )
 
     def _create_sample(self) -> pd.DataFrame:
-        """Create representative sample preserving data distribution."""
+        """Create representative sample preserving data distribution.
+
+        Rows are chosen by position and gathered from the original frame in
+        a single ``take``; no intermediate frames are built.
+        """
         df = self.original_df
+        null_matrix = df.isna().to_numpy()
+        null_positions = np.flatnonzero(null_matrix.any(axis=1))
 
-        # Always include rows with nulls (up to 10% of sample)
-        null_rows = df[df.isna().any(axis=1)]
+        # Always include rows with nulls (up to 10% of sample). Positions are
+        # drawn exactly as ``null_rows.sample(max_null_rows, random_state=42)``.
         max_null_rows = SAMPLE_SIZE // 10
-        if len(null_rows) > max_null_rows:
-            null_sample = null_rows.sample(max_null_rows, random_state=42)
-        elif len(null_rows) > 0:
-            null_sample = null_rows
-        else:
-            null_sample = df.iloc[:0]
+        if len(null_positions) > max_null_rows:
+            picked = np.random.RandomState(42).choice(
+                len(null_positions), size=max_null_rows, replace=False
+            )
+            null_positions = null_positions[picked]
+
+        # Sample remaining rows from everything not already taken
+        remaining_size = SAMPLE_SIZE - len(null_positions)
+        keep = np.ones(len(df), dtype=bool)
+        keep[null_positions] = False
+        rest_positions = np.flatnonzero(keep)
 
-        # Sample remaining rows
-        remaining_size = SAMPLE_SIZE - len(null_sample)
-        non_null_rows = df.drop(null_sample.index, errors="ignore")
+        # Columns that are entirely null among the remaining rows
+        rest_nulls = null_matrix.sum(axis=0) - null_matrix[null_positions].sum(axis=0)
+        all_null = {
+            col
+            for col, count in zip(df.columns, rest_nulls)
+            if count == len(rest_positions)
+        }
 
         # Try stratified sampling on first low-cardinality column
-        strat_col = self._find_stratification_column(non_null_rows)
+        strat_col = self._find_stratification_column(df, all_null, rows=keep)
         if strat_col:
-            main_sample = self._stratified_sample(
-                non_null_rows, strat_col, remaining_size
+            main_positions = self._stratified_positions(
+                df[strat_col].iloc[rest_positions], remaining_size
             )
         else:
-            actual_size = min(remaining_size, len(non_null_rows))
-            main_sample = non_null_rows.sample(actual_size, random_state=42)
+            # Same draw as ``DataFrame.sample(actual_size, random_state=42)``
+            actual_size = min(remaining_size, len(rest_positions))
+            main_positions = np.random.RandomState(42).choice(
+                len(rest_positions), size=actual_size, replace=False
+            )
+
+        positions = np.concatenate([null_positions, rest_positions[main_positions]])
+        return df.take(positions).reset_index(drop=True)
 
-        return pd.concat([null_sample, main_sample]).reset_index(drop=True)
+    def _find_stratification_column(
+        self,
+        df: pd.DataFrame,
+        all_null: set[Any] | None = None,
+        rows: np.ndarray | None = None,
+    ) -> str | None:
+        """Find a good column for stratified sampling.
 
-    def _find_stratification_column(self, df: pd.DataFrame) -> str | None:
-        """Find a good column for stratified sampling."""
+        Only the rows selected by the boolean mask ``rows`` are considered
+        (all rows by default). ``all_null`` names columns already known to be
+        entirely null in those rows.
+        """
+        excluded = 0 if rows is None else len(rows) - int(np.count_nonzero(rows))
         for col in df.columns:
-            if df[col].isna().all():
+            if all_null is not None and col in all_null:
                 continue
-            nunique = df[col].nunique()
+            column = df[col]
+            if all_null is None and column.isna().all():
+                continue
+            # Most columns have too many values, which a prefix already
+            # shows; only the others get a full count
+            head = column.iloc[:CARDINALITY_PROBE_ROWS]
+            if rows is not None:
+                head = head[rows[:CARDINALITY_PROBE_ROWS]]
+            if head.nunique() > 20:
+                continue
+            nunique = column.nunique()
+            if excluded:
+                # Dropping ``excluded`` rows removes at most that many values,
+                # so most columns are settled without slicing them
+                if nunique < 2 or nunique - excluded > 20:
+                    continue
+                nunique = column.iloc[rows].nunique()
             if 2 <= nunique <= 20:
                 return col
         return None
 
-    def _stratified_sample(
-        self, df: pd.DataFrame, strat_col: str, n: int
-    ) -> pd.DataFrame:
-        """Stratified sampling proportional to group sizes."""
-        groups = df.groupby(strat_col, group_keys=False, observed=True)
-        total = len(df)
+    def _stratified_positions(self, column: pd.Series, n: int) -> np.ndarray:
+        """Positions of a sample of ``column``, stratified by its values.
+
+        Each group contributes in proportion to its size, at least one row.
+        Positions are drawn per group exactly as ``group.sample`` would.
+        """
+        codes, _ = pd.factorize(column, sort=True)
+        sizes = np.bincount(codes[codes >= 0])
+        if len(sizes) < np.iinfo(np.int16).max:
+            codes = codes.astype(np.int16)  # stable argsort radix-sorts these
+        order = np.argsort(codes, kind="stable")
+        # Null keys (code -1) sort first and are dropped, as in groupby
+        bounds = np.cumsum(sizes) + np.count_nonzero(codes < 0)
+        total = len(column)
         parts = []
-        for _name, group in groups:
-            group_n = max(1, int(n * len(group) / total))
-            group_n = min(group_n, len(group))
-            parts.append(group.sample(group_n, random_state=42))
-        return pd.concat(parts)
+        for end, size in zip(bounds, sizes):
+            group_n = max(1, int(n * size / total))
+            group_n = min(group_n, size)
+            picked = np.random.RandomState(42).choice(size, group_n, replace=False)
+            parts.append(order[end - size : end][picked])
+        return np.concatenate(parts)
 
     def extrapolate_count(self, sample_count: int) -> int:
         """Scale sample count to full dataset estimate."""
         if not self.is_sampled:
             return sample_count
         return int(sample_count * self.scale_factor)
+
+    def extrapolate_memory(self, df: pd.DataFrame) -> int:
+        """Estimate ``df.memory_usage(deep=True).sum()`` without the deep pass.
+
+        ``df`` must have the sample's columns in the same order. Fixed-width
+        storage is read off ``df`` exactly; the extra bytes held by Python
+        objects are measured on the sample and scaled up.
+        """
+        if not self.is_sampled:
+            return int(df.memory_usage(deep=True).sum())
+        shallow = int(df.memory_usage(deep=False).sum())
+        sample = self.sample_df
+        extra = sample.memory_usage(deep=True, index=False).to_numpy() - (
+            sample.memory_usage(deep=False, index=False).to_numpy()
+        )
+        return shallow + int(extra.sum() * self.scale_factor)
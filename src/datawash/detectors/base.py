@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import pandas as pd
 
+from datawash.core.column_stats import ColumnStats, scan_column
 from datawash.core.models import DatasetProfile, Finding
 
 
@@ -25,3 +27,31 @@ class BaseDetector(ABC):
     @abstractmethod
     def detect(self, df: pd.DataFrame, profile: DatasetProfile) -> list[Finding]:
         """Run detection and return findings."""
+
+
+def get_text_stats(
+    df: pd.DataFrame, profile: DatasetProfile, column: str
+) -> Optional[ColumnStats]:
+    """Return the profiled string statistics for ``column``.
+
+    Falls back to scanning the column when the profile does not carry them.
+    Returns None for non-string columns.
+    """
+    col_profile = profile.columns.get(column)
+    if col_profile is not None and col_profile.text_stats is not None:
+        return col_profile.text_stats
+    return scan_column(df[column])
+
+
+def text_columns(df: pd.DataFrame) -> list[str]:
+    """Return the columns whose dtype can hold strings, in frame order.
+
+    Decided from ``df.dtypes`` alone (object, string and categorical dtypes),
+    without touching column data; :func:`get_text_stats` still has the final
+    say for each candidate.
+    """
+    return [
+        col
+        for col, dtype in df.dtypes.items()
+        if pd.api.types.is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype)
+    ]
@@ -7,6 +7,7 @@ import pandas as pd
 from datawash.core.models import DatasetProfile, Finding, Severity
 from datawash.detectors.base import BaseDetector
 from datawash.detectors.registry import register_detector
+from datawash.profiler.statistics import count_duplicates
 
 
 class DuplicateDetector(BaseDetector):
@@ -32,8 +33,11 @@ class DuplicateDetector(BaseDetector):
         else:
             severity = Severity.LOW
 
-        dup_mask = df.duplicated(keep="first")
-        dup_indices = df.index[dup_mask].tolist()[:100]  # Cap for memory
+        # The profiler records the first duplicate rows while counting them
+        dup_indices = profile.duplicate_rows
+        if not dup_indices:
+            # e.g. streamed profiles, which count duplicates from row hashes
+            _, dup_indices = count_duplicates(df)
 
         findings.append(
             Finding(
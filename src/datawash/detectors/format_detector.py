@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import pandas as pd
 
+from datawash.core.column_stats import ColumnStats
 from datawash.core.models import DatasetProfile, Finding, Severity
-from datawash.detectors.base import BaseDetector
+from datawash.detectors.base import BaseDetector, get_text_stats, text_columns
 from datawash.detectors.registry import register_detector
 
 
@@ -20,36 +21,34 @@ class FormatDetector(BaseDetector):
 
     def detect(self, df: pd.DataFrame, profile: DatasetProfile) -> list[Finding]:
         findings: list[Finding] = []
-        for col_name in df.columns:
-            if not pd.api.types.is_string_dtype(df[col_name]):
-                continue
-            clean = df[col_name].dropna().astype(str)
-            if clean.empty or len(clean) < 5:
+        for col_name in text_columns(df):
+            stats = get_text_stats(df, profile, col_name)
+            if stats is None or stats.non_null_count < 5:
                 continue
 
             # Check for mixed case patterns
-            case_finding = self._check_case_inconsistency(col_name, clean)
+            case_finding = self._check_case_inconsistency(col_name, stats)
             if case_finding:
                 findings.append(case_finding)
 
             # Check for mixed date formats
-            date_finding = self._check_date_formats(col_name, clean)
+            date_finding = self._check_date_formats(col_name, stats)
             if date_finding:
                 findings.append(date_finding)
 
             # Check for mixed whitespace/padding
-            ws_finding = self._check_whitespace(col_name, clean)
+            ws_finding = self._check_whitespace(col_name, stats)
             if ws_finding:
                 findings.append(ws_finding)
 
         return findings
 
     def _check_case_inconsistency(
-        self, col_name: str, series: pd.Series
+        self, col_name: str, stats: ColumnStats
     ) -> Finding | None:
-        has_upper = series.str.isupper().any()
-        has_lower = series.str.islower().any()
-        has_title = series.str.istitle().any()
+        has_upper = stats.has_upper
+        has_lower = stats.has_lower
+        has_title = stats.has_title
         case_types = sum([has_upper, has_lower, has_title])
         if case_types >= 2:
             return Finding(
@@ -58,9 +57,9 @@ class FormatDetector(BaseDetector):
                 severity=Severity.LOW,
                 columns=[col_name],
                 details={
-                    "has_upper": bool(has_upper),
-                    "has_lower": bool(has_lower),
-                    "has_title": bool(has_title),
+                    "has_upper": has_upper,
+                    "has_lower": has_lower,
+                    "has_title": has_title,
                 },
                 message=(
                     f"Column '{col_name}' has inconsistent "
@@ -70,24 +69,11 @@ class FormatDetector(BaseDetector):
             )
         return None
 
-    _DATE_PATTERNS: list[tuple[str, str]] = [
-        ("iso", r"^\d{4}-\d{2}-\d{2}"),
-        ("slash_mdy", r"^\d{1,2}/\d{1,2}/\d{2,4}$"),
-        ("dash_dmy", r"^\d{1,2}-[A-Za-z]{3}-\d{2,4}$"),
-        ("named_mdy", r"^[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4}$"),
-        ("named_dmy", r"^\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}$"),
-    ]
-
-    def _check_date_formats(self, col_name: str, series: pd.Series) -> Finding | None:
+    def _check_date_formats(self, col_name: str, stats: ColumnStats) -> Finding | None:
         # Count how many distinct format patterns appear
-        format_counts: dict[str, int] = {}
-        for fmt_name, pattern in self._DATE_PATTERNS:
-            count = int(series.str.match(pattern).sum())
-            if count > 0:
-                format_counts[fmt_name] = count
-
+        format_counts = stats.date_format_counts
         total_matched = sum(format_counts.values())
-        if len(format_counts) >= 2 and total_matched / len(series) >= 0.5:
+        if len(format_counts) >= 2 and total_matched / stats.non_null_count >= 0.5:
             detail_str = ", ".join(
                 f"{count} {name}" for name, count in format_counts.items()
             )
@@ -97,7 +83,7 @@ class FormatDetector(BaseDetector):
                 severity=Severity.MEDIUM,
                 columns=[col_name],
                 details={
-                    "format_counts": format_counts,
+                    "format_counts": dict(format_counts),
                     "total_matched": total_matched,
                 },
                 message=(
@@ -107,10 +93,10 @@ class FormatDetector(BaseDetector):
             )
         return None
 
-    def _check_whitespace(self, col_name: str, series: pd.Series) -> Finding | None:
-        leading = (series != series.str.lstrip()).sum()
-        trailing = (series != series.str.rstrip()).sum()
-        total = int(leading + trailing)
+    def _check_whitespace(self, col_name: str, stats: ColumnStats) -> Finding | None:
+        leading = stats.leading_whitespace
+        trailing = stats.trailing_whitespace
+        total = leading + trailing
         if total > 0:
             return Finding(
                 detector=self.name,
@@ -118,8 +104,8 @@ class FormatDetector(BaseDetector):
                 severity=Severity.LOW,
                 columns=[col_name],
                 details={
-                    "leading_spaces": int(leading),
-                    "trailing_spaces": int(trailing),
+                    "leading_spaces": leading,
+                    "trailing_spaces": trailing,
                 },
                 message=f"Column '{col_name}' has {total} values with leading/trailing whitespace",
                 confidence=1.0,
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pandas as pd
 
 from datawash.core.models import DatasetProfile, Finding, Severity
-from datawash.detectors.base import BaseDetector
+from datawash.detectors.base import BaseDetector, get_text_stats, text_columns
 from datawash.detectors.registry import register_detector
 
 
@@ -52,10 +52,10 @@ class MissingDetector(BaseDetector):
             )
 
         # Detect columns with empty or whitespace-only strings
-        for col_name in df.columns:
-            if pd.api.types.is_string_dtype(df[col_name]):
-                stripped = df[col_name].dropna().astype(str).str.strip()
-                empty_count = int((stripped == "").sum())
+        for col_name in text_columns(df):
+            stats = get_text_stats(df, profile, col_name)
+            if stats is not None:
+                empty_count = stats.empty_count
                 if empty_count > 0:
                     findings.append(
                         Finding(
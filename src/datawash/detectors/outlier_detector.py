@@ -9,6 +9,11 @@ from datawash.core.models import DatasetProfile, Finding, Severity
 from datawash.detectors.base import BaseDetector
 from datawash.detectors.registry import register_detector
 
+# Dtypes whose values float32 represents exactly
+_FLOAT32_EXACT = frozenset(
+    np.dtype(t) for t in ("float32", "int8", "int16", "uint8", "uint16")
+)
+
 
 class OutlierDetector(BaseDetector):
     def __init__(self, method: str = "iqr", threshold: float = 1.5) -> None:
@@ -25,20 +30,49 @@ class OutlierDetector(BaseDetector):
 
     def detect(self, df: pd.DataFrame, profile: DatasetProfile) -> list[Finding]:
         findings: list[Finding] = []
-        for col_name in df.select_dtypes(include=[np.number]).columns:
-            series = df[col_name].dropna()
-            if len(series) < 10:
+        numeric = df.select_dtypes(include=[np.number])
+        if numeric.shape[1] == 0:
+            return findings
+        # Quartiles are interpolated in float64 from exact order statistics,
+        # so IQR bounds are the same when the values are held as float32
+        dtype = (
+            np.float32
+            if self._method == "iqr" and set(numeric.dtypes) <= _FLOAT32_EXACT
+            else np.float64
+        )
+        # One row per column, so each column is a contiguous slice
+        matrix = np.ascontiguousarray(numeric.to_numpy(dtype=dtype, na_value=np.nan).T)
+        valid = ~np.isnan(matrix)
+        counts = valid.sum(axis=1)
+        if self._method == "iqr":
+            q1, q3 = self._column_quartiles(matrix, valid, counts)
+        else:
+            mean, std = self._column_moments(matrix, valid, counts)
+
+        for i, col_name in enumerate(numeric.columns):
+            n_valid = int(counts[i])
+            if n_valid < 10:
                 continue
-
+            values = matrix[i]  # NaNs compare False, so they are never flagged
             if self._method == "iqr":
-                outlier_indices = self._iqr_outliers(series)
+                iqr = q3[i] - q1[i]
+                if iqr == 0:
+                    continue
+                lower = q1[i] - self._threshold * iqr
+                upper = q3[i] + self._threshold * iqr
+                mask = (values < lower) | (values > upper)
             else:
-                outlier_indices = self._zscore_outliers(series)
+                if std[i] == 0:
+                    continue
+                mask = np.abs((values - mean[i]) / std[i]) > self._threshold
 
-            if len(outlier_indices) == 0:
+            outlier_count = int(np.count_nonzero(mask))
+            if outlier_count == 0:
                 continue
+            # Row labels of the first outliers only; the rest are just counted
+            positions = np.flatnonzero(mask)[:100]
 
-            ratio = len(outlier_indices) / len(series)
+            ratio = outlier_count / n_valid
             severity = (
                 Severity.HIGH
                 if ratio > 0.05
@@ -51,16 +85,16 @@ class OutlierDetector(BaseDetector):
                     issue_type="outliers",
                     severity=severity,
                     columns=[col_name],
-                    rows=outlier_indices[:100],
+                    rows=df.index[positions].tolist(),
                     details={
-                        "outlier_count": len(outlier_indices),
+                        "outlier_count": outlier_count,
                         "outlier_ratio": round(ratio, 4),
                         "method": self._method,
                         "threshold": self._threshold,
                     },
                     message=(
                         f"Column '{col_name}' has "
-                        f"{len(outlier_indices)} outliers "
+                        f"{outlier_count} outliers "
                         f"({ratio:.1%}) detected by "
                         f"{self._method.upper()}"
                     ),
@@ -69,25 +103,63 @@ class OutlierDetector(BaseDetector):
             )
         return findings
 
-    def _iqr_outliers(self, series: pd.Series) -> list[int]:
-        q1 = series.quantile(0.25)
-        q3 = series.quantile(0.75)
-        iqr = q3 - q1
-        if iqr == 0:
-            return []
-        lower = q1 - self._threshold * iqr
-        upper = q3 + self._threshold * iqr
-        mask = (series < lower) | (series > upper)
-        return series.index[mask].tolist()
-
-    def _zscore_outliers(self, series: pd.Series) -> list[int]:
-        mean = series.mean()
-        std = series.std()
-        if std == 0:
-            return []
-        z_scores = ((series - mean) / std).abs()
-        mask = z_scores > self._threshold
-        return series.index[mask].tolist()
+    @staticmethod
+    def _column_quartiles(
+        matrix: np.ndarray, valid: np.ndarray, counts: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """First and third quartile of each row of ``matrix``, ignoring NaN.
+
+        Rows without NaN are handled by one partition of the whole block.
+        """
+        q1 = np.full(len(matrix), np.nan)
+        q3 = np.full(len(matrix), np.nan)
+        complete = counts == matrix.shape[1]
+        if complete.any() and matrix.shape[1]:
+            rows = matrix if complete.all() else matrix[complete]
+            q1[complete], q3[complete] = _linear_quartiles(rows)
+        for i in np.flatnonzero(~complete & (counts > 0)):
+            q1[i : i + 1], q3[i : i + 1] = _linear_quartiles(
+                matrix[i][valid[i]][None, :]
+            )
+        return q1, q3
+
+    @staticmethod
+    def _column_moments(
+        matrix: np.ndarray, valid: np.ndarray, counts: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Mean and sample standard deviation of each row, ignoring NaN."""
+        mean = np.full(len(matrix), np.nan)
+        std = np.full(len(matrix), np.nan)
+        complete = (counts == matrix.shape[1]) & (counts > 1)
+        if complete.any():
+            rows = matrix if complete.all() else matrix[complete]
+            mean[complete] = rows.mean(axis=1)
+            std[complete] = rows.std(axis=1, ddof=1)
+        for i in np.flatnonzero(~complete & (counts > 1)):
+            clean = matrix[i][valid[i]]
+            mean[i] = clean.mean()
+            std[i] = clean.std(ddof=1)
+        return mean, std
+
+
+def _linear_quartiles(rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """``np.quantile(rows, [0.25, 0.75], axis=1)`` of NaN-free rows, in float64.
+
+    Order statistics are selected in the input dtype and only they are
+    promoted, then interpolated exactly as NumPy's linear method does; float32
+    input gives the same result as its float64 upcast.
+    """
+    n = rows.shape[1]
+    virtual = np.array([0.25, 0.75]) * (n - 1)
+    prev = np.floor(virtual).astype(np.intp)
+    nxt = np.minimum(prev + 1, n - 1)
+    gamma = virtual - prev
+    part = np.partition(rows, np.unique(np.r_[prev, nxt]), axis=1)
+    a = part[:, prev].astype(np.float64)
+    b = part[:, nxt].astype(np.float64)
+    diff = b - a
+    quartiles = np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+    return quartiles[:, 0], quartiles[:, 1]
 
 
 register_detector(OutlierDetector())
@@ -13,15 +13,40 @@ Based on:
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+import math
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from datawash.core.models import DatasetProfile, Finding, Severity
 from datawash.detectors.base import BaseDetector
 from datawash.detectors.registry import register_detector
 
+try:
+    import Levenshtein  # C implementation from the "ml" extra
+except ImportError:
+    Levenshtein = None  # type: ignore[assignment, unused-ignore]
+
+# Values hashed per broadcast; bounds the temporary array's size
+_MINHASH_BLOCK = 4096
+
+
+@lru_cache(maxsize=None)
+def _minhash_coefficients(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Multiply-shift hash family for MinHash, as column vectors.
+
+    Multipliers are odd; the seed is fixed so signatures are the same in
+    every process.
+    """
+    rng = np.random.default_rng(0x5EED)
+    a = rng.integers(1, 2**63, size=n, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, size=n, dtype=np.uint64)
+    return a[:, None], b[:, None]
+
 
 class SimilarityDetector(BaseDetector):
     """Detect similar columns using MinHash + LSH.
@@ -68,14 +93,10 @@ class SimilarityDetector(BaseDetector):
         if n_cols < 2:
             return []
 
-        # Precompute value sets (use unique() first to reduce work)
-        column_value_sets: dict[int, set[str]] = {}
-        for idx, col in enumerate(columns):
-            unique_vals = df[col].dropna().unique()
-            if len(unique_vals) > self.MAX_UNIQUE_VALUES:
-                column_value_sets[idx] = set()  # Too many unique values (likely IDs)
-            else:
-                column_value_sets[idx] = set(str(v) for v in unique_vals)
+        # Precompute value sets
+        column_value_sets = {
+            idx: self._value_set(df.iloc[:, idx]) for idx in range(n_cols)
+        }
 
         # Stage 1: Blocking
         name_candidates = self._ngram_blocking(columns)
@@ -95,6 +116,21 @@ class SimilarityDetector(BaseDetector):
 
         return findings
 
+    def _value_set(self, series: pd.Series) -> set[str]:
+        """Distinct non-null values of ``series`` as strings.
+
+        Nulls are dropped from the uniques rather than the column, and only
+        the uniques are converted to ``str``. Columns with more than
+        ``MAX_UNIQUE_VALUES`` distinct values (likely IDs) get an empty set.
+        """
+        uniques = series.unique()
+        uniques = uniques[~pd.isna(uniques)]
+        if len(uniques) > self.MAX_UNIQUE_VALUES:
+            return set()
+        if isinstance(series.dtype, pd.StringDtype):
+            return set(uniques)  # already str
+        return set(map(str, uniques))
+
     # -----------------------------------------------------------------
     # STAGE 1a: N-GRAM BLOCKING FOR NAMES
     # -----------------------------------------------------------------
@@ -102,29 +138,38 @@ class SimilarityDetector(BaseDetector):
     def _ngram_blocking(self, columns: list[str]) -> set[tuple[int, int]]:
         """Find candidate pairs based on shared character n-grams.
 
+        Each column counts its shared n-grams per later partner column with
+        one ``np.bincount`` over its posting lists, instead of enumerating
+        every pair inside every posting list in Python.
+
         Complexity: O(n * k) where k = average column name length
         """
+        column_ngrams = [self._get_ngrams(col.lower()) for col in columns]
         ngram_index: dict[str, list[int]] = defaultdict(list)
-
-        for idx, col in enumerate(columns):
-            ngrams = self._get_ngrams(col.lower())
+        for idx, ngrams in enumerate(column_ngrams):
             for ng in ngrams:
                 ngram_index[ng].append(idx)
+        # Ascending column positions; single-column lists share nothing
+        postings = {
+            ng: np.array(indices, dtype=np.intp)
+            for ng, indices in ngram_index.items()
+            if len(indices) > 1
+        }
 
-        pair_counts: Counter[tuple[int, int]] = Counter()
-        for indices in ngram_index.values():
-            if len(indices) < 2:
+        candidates: set[tuple[int, int]] = set()
+        for i, ngrams in enumerate(column_ngrams):
+            partners = [
+                p[np.searchsorted(p, i, side="right") :]
+                for ng in ngrams
+                if (p := postings.get(ng)) is not None and p[-1] > i
+            ]
+            if len(partners) < self.MIN_SHARED_NGRAMS:
                 continue
-            for i in range(len(indices)):
-                for j in range(i + 1, len(indices)):
-                    pair = (min(indices[i], indices[j]), max(indices[i], indices[j]))
-                    pair_counts[pair] += 1
-
-        return {
-            pair
-            for pair, count in pair_counts.items()
-            if count >= self.MIN_SHARED_NGRAMS
-        }
+            shared = np.bincount(np.concatenate(partners))
+            candidates.update(
+                (i, int(j)) for j in np.flatnonzero(shared >= self.MIN_SHARED_NGRAMS)
+            )
+        return candidates
 
     def _get_ngrams(self, s: str) -> set[str]:
         """Extract character n-grams from string."""
@@ -149,13 +194,10 @@ class SimilarityDetector(BaseDetector):
         """
         n_cols = len(columns)
 
-        # Generate MinHash signatures for each column
-        signatures: list[list[int]] = []
-        sizes: list[int] = []
-        for idx in range(n_cols):
-            val_set = column_value_sets.get(idx, set())
-            signatures.append(self._minhash_signature(val_set))
-            sizes.append(len(val_set))
+        # Generate MinHash signatures for all columns, one row per column
+        value_sets = [column_value_sets.get(idx, set()) for idx in range(n_cols)]
+        signatures = self._minhash_signatures(value_sets)
+        sizes = [len(val_set) for val_set in value_sets]
 
         # LSH Banding: hash signature bands into buckets
         candidates: set[tuple[int, int]] = set()
@@ -165,15 +207,9 @@ class SimilarityDetector(BaseDetector):
         max_ratio = (2 - self._value_threshold) / self._value_threshold
 
         for band_idx in range(self.LSH_BANDS):
-            buckets: dict[int, list[int]] = defaultdict(list)
             start = band_idx * rows_per_band
             end = start + rows_per_band
-
-            for col_idx, sig in enumerate(signatures):
-                band_hash = hash(tuple(sig[start:end]))
-                buckets[band_hash].append(col_idx)
-
-            for bucket_cols in buckets.values():
+            for bucket_cols in self._band_buckets(signatures[:, start:end]):
                 if len(bucket_cols) < 2 or len(bucket_cols) > 50:
                     # Skip very large buckets (too many false positives)
                     continue
@@ -193,15 +229,65 @@ class SimilarityDetector(BaseDetector):
 
         return candidates
 
-    def _minhash_signature(self, values: set[str]) -> list[int]:
-        """Generate MinHash signature for a set of values."""
-        if not values:
-            return [0] * self.MINHASH_SIGNATURES
-        signature = []
-        for seed in range(self.MINHASH_SIGNATURES):
-            min_hash = min(hash((seed, v)) % (2**32) for v in values)
-            signature.append(min_hash)
-        return signature
+    @staticmethod
+    def _band_buckets(band: np.ndarray) -> list[list[int]]:
+        """Group columns (rows of ``band``) with identical band values.
+
+        Only buckets of two or more columns are returned, ordered by their
+        first column; each lists its columns in ascending order.
+        """
+        # Stable sort on every band value; equal rows end up adjacent, in
+        # column order
+        order = np.lexsort(band.T[::-1])
+        ordered = band[order]
+        starts = np.flatnonzero(np.r_[True, (ordered[1:] != ordered[:-1]).any(axis=1)])
+        sizes = np.diff(np.r_[starts, len(order)])
+        shared = sizes > 1
+        groups = [
+            order[start : start + size].tolist()
+            for start, size in zip(starts[shared], sizes[shared])
+        ]
+        groups.sort(key=lambda group: group[0])
+        return groups
+
+    def _minhash_signatures(self, value_sets: list[set[str]]) -> np.ndarray:
+        """Generate MinHash signatures for several sets of values at once.
+
+        All values are hashed in one call; the ``MINHASH_SIGNATURES`` hash
+        functions are multiply-shift permutations of that hash. The flat hash
+        array is processed in blocks of ``_MINHASH_BLOCK`` values, and each
+        block's minima are reduced per set with one ``np.minimum.reduceat``,
+        so many small sets share a broadcast. Empty sets get all-zero rows.
+
+        Returns:
+            ``uint64`` array of shape ``(len(value_sets), MINHASH_SIGNATURES)``.
+        """
+        sizes = np.fromiter(map(len, value_sets), dtype=np.intp, count=len(value_sets))
+        signatures = np.zeros((len(value_sets), self.MINHASH_SIGNATURES), np.uint64)
+        total = int(sizes.sum())
+        if total == 0:
+            return signatures
+        values = np.empty(total, dtype=object)
+        values[:] = list(chain.from_iterable(value_sets))
+        hashes = pd.util.hash_array(values)
+
+        # Only non-empty sets own a segment of ``hashes``
+        owners = np.flatnonzero(sizes)
+        starts = np.cumsum(sizes)[owners] - sizes[owners]
+        ends = starts + sizes[owners]
+        signatures[owners] = np.iinfo(np.uint64).max
+        a, b = _minhash_coefficients(self.MINHASH_SIGNATURES)
+        for block_start in range(0, total, _MINHASH_BLOCK):
+            block_end = min(block_start + _MINHASH_BLOCK, total)
+            permuted = (a * hashes[block_start:block_end] + b) >> np.uint64(32)
+            # Sets overlapping this block, and where each begins inside it
+            first = np.searchsorted(ends, block_start, side="right")
+            last = np.searchsorted(starts, block_end, side="left")
+            offsets = np.maximum(starts[first:last], block_start) - block_start
+            minima = np.minimum.reduceat(permuted, offsets, axis=1)
+            rows = owners[first:last]
+            signatures[rows] = np.minimum(signatures[rows], minima.T)
+        return signatures
 
     # -----------------------------------------------------------------
     # STAGE 3: VERIFICATION
@@ -217,10 +303,21 @@ class SimilarityDetector(BaseDetector):
         """Verify if a candidate pair is actually similar."""
         col1, col2 = columns[i], columns[j]
 
-        name_sim = self._normalized_levenshtein(col1.lower(), col2.lower())
         set1 = column_value_sets.get(i, set())
         set2 = column_value_sets.get(j, set())
+
+        # Jaccard is at most the size ratio, so some pairs fail the combined
+        # threshold before any set is compared; the exact value score then
+        # bounds how far the name comparison has to go
+        value_bound = self._jaccard_bound(len(set1), len(set2))
+        if 0.4 + 0.6 * value_bound < self.COMBINED_THRESHOLD:
+            return None
         value_sim = self._jaccard_similarity(set1, set2)
+        name_sim = self._normalized_levenshtein(
+            col1.lower(),
+            col2.lower(),
+            min_similarity=(self.COMBINED_THRESHOLD - 0.6 * value_sim) / 0.4,
+        )
 
         combined_score = 0.4 * name_sim + 0.6 * value_sim
         if combined_score < self.COMBINED_THRESHOLD:
@@ -249,8 +346,14 @@ class SimilarityDetector(BaseDetector):
     # HELPERS
     # -----------------------------------------------------------------
 
-    def _normalized_levenshtein(self, s1: str, s2: str) -> float:
-        """Calculate normalized Levenshtein similarity (0 to 1)."""
+    def _normalized_levenshtein(
+        self, s1: str, s2: str, min_similarity: float = 0.0
+    ) -> float:
+        """Calculate normalized Levenshtein similarity (0 to 1).
+
+        Returns 0.0 as soon as the similarity is certain to be below
+        ``min_similarity``.
+        """
         if s1 == s2:
             return 1.0
         len1, len2 = len(s1), len(s2)
@@ -262,12 +365,38 @@ class SimilarityDetector(BaseDetector):
         if abs(len1 - len2) / max_len > (1 - self._name_threshold):
             return 0.0
 
+        # Once the distance exceeds this (one edit of slack for rounding) the
+        # similarity cannot reach ``min_similarity``
+        max_distance = max(0, math.floor((1 - min_similarity) * max_len) + 1)
+        if Levenshtein is not None:
+            distance: int = Levenshtein.distance(s1, s2, score_cutoff=max_distance)
+        else:
+            distance = self._bounded_distance(s1, s2, max_distance)
+        if distance > max_distance:
+            return 0.0
+        return 1 - (distance / max_len)
+
+    @staticmethod
+    def _bounded_distance(s1: str, s2: str, max_distance: int) -> int:
+        """Levenshtein distance, or ``max_distance + 1`` once it is exceeded."""
+        # A shared prefix or suffix never adds edits; column names often
+        # differ only in the middle or at one end
+        start = 0
+        limit = min(len(s1), len(s2))
+        while start < limit and s1[start] == s2[start]:
+            start += 1
+        end = 0
+        limit -= start
+        while end < limit and s1[-1 - end] == s2[-1 - end]:
+            end += 1
+        s1 = s1[start : len(s1) - end]
+        s2 = s2[start : len(s2) - end]
+
         # Two-row Levenshtein
-        if len1 > len2:
+        if len(s1) > len(s2):
             s1, s2 = s2, s1
-            len1, len2 = len2, len1
 
-        previous_row = list(range(len2 + 1))
+        previous_row = list(range(len(s2) + 1))
         for i, c1 in enumerate(s1):
             current_row = [i + 1]
             for j, c2 in enumerate(s2):
@@ -275,10 +404,20 @@ class SimilarityDetector(BaseDetector):
                 deletions = current_row[j] + 1
                 substitutions = previous_row[j] + (c1 != c2)
                 current_row.append(min(insertions, deletions, substitutions))
+            # The smallest entry of a row never decreases in later rows
+            if min(current_row) > max_distance:
+                return max_distance + 1
             previous_row = current_row
+        return previous_row[-1]
 
-        distance = previous_row[-1]
-        return 1 - (distance / max_len)
+    @staticmethod
+    def _jaccard_bound(size1: int, size2: int) -> float:
+        """Upper bound of the Jaccard similarity of sets of these sizes."""
+        if size1 == 0 and size2 == 0:
+            return 1.0
+        if size1 == 0 or size2 == 0:
+            return 0.0
+        return min(size1, size2) / max(size1, size2)
 
     def _jaccard_similarity(self, set1: set[str], set2: set[str]) -> float:
         """Calculate exact Jaccard similarity."""
@@ -287,7 +426,7 @@ class SimilarityDetector(BaseDetector):
         if not set1 or not set2:
             return 0.0
         intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        union = len(set1) + len(set2) - intersection  # no need to build it
         return intersection / union if union > 0 else 0.0
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pandas as pd
 
 from datawash.core.models import DatasetProfile, Finding, Severity
-from datawash.detectors.base import BaseDetector
+from datawash.detectors.base import BaseDetector, get_text_stats
 from datawash.detectors.registry import register_detector
 
 
@@ -22,20 +22,13 @@ class TypeDetector(BaseDetector):
         findings: list[Finding] = []
 
         for col_name, col_profile in profile.columns.items():
-            is_string = pd.api.types.is_string_dtype(df[col_name])
+            stats = get_text_stats(df, profile, col_name)
 
             # Flag numeric columns stored as strings
-            if is_string:
-                series = df[col_name].dropna()
-                if series.empty:
+            if stats is not None:
+                if stats.non_null_count == 0:
                     continue
-                # Sample for large columns to avoid expensive pd.to_numeric
-                if len(series) > 1000:
-                    sample = series.sample(1000, random_state=42)
-                else:
-                    sample = series
-                numeric_count = pd.to_numeric(sample, errors="coerce").notna().sum()
-                ratio = numeric_count / len(sample)
+                ratio = stats.numeric_ratio
                 if ratio > 0.8:
                     findings.append(
                         Finding(
@@ -54,40 +47,22 @@ class TypeDetector(BaseDetector):
                     )
 
             # Flag boolean-like columns
-            if is_string:
-                bool_values = {
-                    "true",
-                    "false",
-                    "yes",
-                    "no",
-                    "y",
-                    "n",
-                    "1",
-                    "0",
-                    "t",
-                    "f",
-                    "on",
-                    "off",
-                }
-                lowered_unique = set(
-                    df[col_name].dropna().astype(str).str.strip().str.lower().unique()
-                )
-                if lowered_unique <= bool_values and len(lowered_unique) >= 2:
-                    findings.append(
-                        Finding(
-                            detector=self.name,
-                            issue_type="boolean_as_string",
-                            severity=Severity.LOW,
-                            columns=[col_name],
-                            details={"values": sorted(lowered_unique)},
-                            message=(
-                                f"Column '{col_name}' contains "
-                                f"boolean-like values "
-                                f"stored as strings"
-                            ),
-                            confidence=0.95,
-                        )
+            if stats is not None and len(stats.boolean_values) >= 2:
+                findings.append(
+                    Finding(
+                        detector=self.name,
+                        issue_type="boolean_as_string",
+                        severity=Severity.LOW,
+                        columns=[col_name],
+                        details={"values": stats.boolean_values},
+                        message=(
+                            f"Column '{col_name}' contains "
+                            f"boolean-like values "
+                            f"stored as strings"
+                        ),
+                        confidence=0.95,
                     )
+                )
 
             # Report detected semantic types from patterns
             if col_profile.patterns:
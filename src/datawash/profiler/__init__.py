@@ -1 +1,2 @@
 from .engine import profile_dataset as profile_dataset
+from .streaming import profile_file as profile_file
@@ -6,13 +6,17 @@ import logging
 import sys
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from datawash.core.column_stats import scan_column
 from datawash.core.models import ColumnProfile, DatasetProfile
 from datawash.profiler.patterns import detect_column_patterns
 from datawash.profiler.statistics import (
     compute_categorical_stats,
     compute_numeric_stats,
+    count_duplicates,
+    count_values,
 )
 
 logger = logging.getLogger(__name__)
@@ -43,37 +47,44 @@ def profile_dataset(df: pd.DataFrame) -> DatasetProfile:
         for col_name in df.columns:
             columns[col_name] = _profile_column(df[col_name])
 
+    duplicate_count, duplicate_rows = count_duplicates(df)
     return DatasetProfile(
         row_count=len(df),
         column_count=len(df.columns),
         memory_bytes=int(df.memory_usage(deep=True).sum()),
         columns=columns,
-        duplicate_row_count=int(df.duplicated().sum()),
+        duplicate_row_count=duplicate_count,
+        duplicate_rows=duplicate_rows,
     )
 
 
 def _profile_column(series: pd.Series) -> ColumnProfile:
     """Profile a single column."""
     name = str(series.name)
-    null_count = int(series.isna().sum())
+    # One null mask serves the count, the statistics and the sample values
+    null_mask = series.isna().to_numpy()
+    null_count = int(np.count_nonzero(null_mask))
+    clean = series[~null_mask] if null_count else series
     total = len(series)
-    unique_count = int(series.nunique())
+    # One hashing pass yields the unique count and the categorical stats
+    value_counts = count_values(series)
+    unique_count = len(value_counts)
 
     # Compute type-appropriate statistics
     stats: dict[str, Any] = {}
     # Boolean columns should use categorical stats (quantile fails on bool)
     if pd.api.types.is_bool_dtype(series):
-        stats = compute_categorical_stats(series)
+        stats = compute_categorical_stats(series, value_counts)
     elif pd.api.types.is_numeric_dtype(series):
-        stats = compute_numeric_stats(series)
+        stats = compute_numeric_stats(clean)
     else:
-        stats = compute_categorical_stats(series)
+        stats = compute_categorical_stats(series, value_counts)
 
     # Detect patterns
     patterns = detect_column_patterns(series)
 
     # Sample values (up to 5 non-null)
-    sample_values = series.dropna().head(5).tolist()
+    sample_values = clean.head(5).tolist()
 
     return ColumnProfile(
         name=name,
@@ -85,4 +96,5 @@ def _profile_column(series: pd.Series) -> ColumnProfile:
         sample_values=sample_values,
         statistics=stats,
         patterns=patterns,
+        text_stats=scan_column(series, value_counts),
     )
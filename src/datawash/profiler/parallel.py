@@ -4,35 +4,54 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from datawash.core.cache import ComputationCache
+from datawash.core.column_stats import scan_column
 from datawash.core.models import ColumnProfile, DatasetProfile, Finding
 from datawash.detectors.base import BaseDetector
+from datawash.detectors.registry import run_detectors
 from datawash.profiler.patterns import detect_column_patterns
 from datawash.profiler.statistics import (
     compute_categorical_stats,
     compute_numeric_stats,
+    count_duplicates,
+    count_values,
 )
 
 logger = logging.getLogger(__name__)
 
-MAX_WORKERS = min(8, os.cpu_count() or 4)
+# Column work is mostly pandas/NumPy kernels that release the GIL. On a
+# free-threaded interpreter the Python-level parts run in parallel too, so
+# allow one thread per core there.
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+MAX_WORKERS = min(8 if _GIL_ENABLED else 32, os.cpu_count() or 4)
+
+
+def _worker_count(n_tasks: int) -> int:
+    return max(1, min(MAX_WORKERS, n_tasks))
 
 
 def profile_dataset_parallel(
     df: pd.DataFrame,
     cache: Optional[ComputationCache] = None,
 ) -> DatasetProfile:
-    """Profile all columns in parallel using ThreadPoolExecutor."""
+    """Profile all columns in parallel using ThreadPoolExecutor.
+
+    Each task profiles one column, including the string statistics the
+    detectors read, so the per-column scans run concurrently. Columns must
+    not be mutated while profiling.
+    """
     columns: dict[str, ColumnProfile] = {}
 
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    with ThreadPoolExecutor(max_workers=_worker_count(len(df.columns))) as executor:
         future_to_col = {
-            executor.submit(_profile_column, df[col_name]): col_name
+            executor.submit(_profile_column, df[col_name], cache): col_name
             for col_name in df.columns
         }
         for future in as_completed(future_to_col):
@@ -43,12 +62,14 @@ def profile_dataset_parallel(
                 logger.exception("Failed to profile column %s", col_name)
                 columns[col_name] = _empty_profile(col_name)
 
+    duplicate_count, duplicate_rows = count_duplicates(df)
     return DatasetProfile(
         row_count=len(df),
         column_count=len(df.columns),
         memory_bytes=int(df.memory_usage(deep=True).sum()),
         columns=columns,
-        duplicate_row_count=int(df.duplicated().sum()),
+        duplicate_row_count=duplicate_count,
+        duplicate_rows=duplicate_rows,
     )
 
 
@@ -57,42 +78,45 @@ def run_detectors_parallel(
     profile: DatasetProfile,
     detectors: dict[str, BaseDetector],
 ) -> list[Finding]:
-    """Run all detectors in parallel."""
-    findings: list[Finding] = []
-
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_name = {
-            executor.submit(detector.detect, df, profile): name
-            for name, detector in detectors.items()
-        }
-        for future in as_completed(future_to_name):
-            name = future_to_name[future]
-            try:
-                results = future.result()
-                findings.extend(results)
-            except Exception:
-                logger.exception("Detector %s failed", name)
-
-    return findings
+    """Run all detectors in parallel; findings keep the detectors' order."""
+    return run_detectors(
+        df, profile, detectors, max_workers=_worker_count(len(detectors))
+    )
 
 
-def _profile_column(series: pd.Series) -> ColumnProfile:
+def _profile_column(
+    series: pd.Series, cache: Optional[ComputationCache] = None
+) -> ColumnProfile:
     """Profile a single column (runs inside thread)."""
     name = str(series.name)
-    null_count = int(series.isna().sum())
+    # One null mask serves the count, the statistics and the sample values;
+    # the cache computes masks for neighbouring columns together
+    null_mask = (
+        cache.get_null_mask(series.name)
+        if cache is not None
+        else series.isna().to_numpy()
+    )
+    null_count = int(np.count_nonzero(null_mask))
+    clean = series[~null_mask] if null_count else series
     total = len(series)
-    unique_count = int(series.nunique())
+    # One hashing pass yields the unique count and the categorical stats
+    value_counts = (
+        cache.get_value_counts(series.name)
+        if cache is not None
+        else count_values(series)
+    )
+    unique_count = len(value_counts)
 
     stats: dict[str, Any] = {}
     if pd.api.types.is_bool_dtype(series):
-        stats = compute_categorical_stats(series)
+        stats = compute_categorical_stats(series, value_counts)
     elif pd.api.types.is_numeric_dtype(series):
-        stats = compute_numeric_stats(series)
+        stats = compute_numeric_stats(clean)
     else:
-        stats = compute_categorical_stats(series)
+        stats = compute_categorical_stats(series, value_counts)
 
     patterns = detect_column_patterns(series)
-    sample_values = series.dropna().head(5).tolist()
+    sample_values = clean.head(5).tolist()
 
     return ColumnProfile(
         name=name,
@@ -104,6 +128,7 @@ def _profile_column(series: pd.Series) -> ColumnProfile:
         sample_values=sample_values,
         statistics=stats,
         patterns=patterns,
+        text_stats=scan_column(series, value_counts),
     )
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 PATTERNS: dict[str, re.Pattern[str]] = {
@@ -19,6 +20,9 @@ PATTERNS: dict[str, re.Pattern[str]] = {
     "zip_us": re.compile(r"^\d{5}(-\d{4})?$"),
 }
 
+# Same digit class as the %Y directive of the date parser
+_DIGIT = re.compile(r"\d")
+
 DATE_FORMATS = [
     "%Y-%m-%d",
     "%m/%d/%Y",
@@ -41,16 +45,21 @@ def detect_column_patterns(series: pd.Series) -> dict[str, Any]:
 
     Returns dict with detected pattern name and match ratio.
     """
-    clean = series.dropna().astype(str)
+    clean = series.dropna()
     if clean.empty:
         return {}
 
-    sample = clean.head(1000)
+    # Only the sampled values are converted to text, and each distinct value
+    # is matched once per pattern and weighted by its frequency
+    sample = clean.head(1000).astype(str)
     total = len(sample)
     results: dict[str, Any] = {}
+    value_counts = sample.value_counts(sort=False)
+    values = value_counts.index.str
+    counts = value_counts.to_numpy()
 
     for name, pattern in PATTERNS.items():
-        matches = sample.str.match(pattern).sum()
+        matches = counts[np.asarray(values.match(pattern), dtype=bool)].sum()
         ratio = matches / total
         if ratio > 0.5:
             results[name] = {
@@ -68,11 +77,25 @@ def detect_column_patterns(series: pd.Series) -> dict[str, Any]:
 
 
 def _detect_date_pattern(sample: pd.Series) -> dict[str, Any] | None:
-    """Try parsing dates with common formats."""
+    """Try parsing dates with common formats.
+
+    Each format is tried on the sample's distinct values, weighted by their
+    counts. Every format needs a four-digit year, so when too few values
+    contain a digit no format is tried at all.
+    """
+    value_counts = sample.value_counts(sort=False)
+    counts = value_counts.to_numpy()
+    uniques = value_counts.index.to_series(index=None)
+    search = _DIGIT.search
+    has_digit = np.fromiter(
+        (search(v) is not None for v in uniques), dtype=bool, count=len(uniques)
+    )
+    if counts[has_digit].sum() / len(sample) <= 0.7:
+        return None
     for fmt in DATE_FORMATS:
         try:
-            parsed = pd.to_datetime(sample, format=fmt, errors="coerce")
-            ratio = parsed.notna().sum() / len(sample)
+            parsed = pd.to_datetime(uniques, format=fmt, errors="coerce")
+            ratio = counts[parsed.notna().to_numpy()].sum() / len(sample)
             if ratio > 0.7:
                 return {"match_ratio": round(float(ratio), 3), "format": fmt}
         except Exception:
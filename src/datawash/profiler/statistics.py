@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -25,17 +26,58 @@ def compute_numeric_stats(series: pd.Series) -> dict[str, Any]:
     }
 
 
-def compute_categorical_stats(series: pd.Series) -> dict[str, Any]:
-    """Compute statistics for a categorical/string column."""
-    clean = series.dropna()
-    if clean.empty:
+# Row labels kept on the profile for the duplicate detector
+MAX_DUPLICATE_ROWS = 100
+
+
+def count_duplicates(df: pd.DataFrame) -> tuple[int, list[Any]]:
+    """Return the duplicate row count and the first duplicate row labels.
+
+    Rows are compared in full; the first occurrence is not counted.
+    """
+    mask = df.duplicated(keep="first").to_numpy()
+    count = int(np.count_nonzero(mask))
+    if count == 0:
+        return 0, []
+    # Slice positions before looking up labels, so only the kept rows are
+    # turned into Python objects
+    positions = np.flatnonzero(mask)[:MAX_DUPLICATE_ROWS]
+    return count, df.index[positions].tolist()
+
+
+def count_values(series: pd.Series) -> pd.Series:
+    """Return non-null value frequencies, most common first.
+
+    Unused categories of a categorical column are dropped, so ``len()`` of the
+    result equals ``series.nunique()``.
+    """
+    value_counts = series.value_counts()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        value_counts = value_counts[value_counts > 0]
+    return value_counts
+
+
+def compute_categorical_stats(
+    series: pd.Series, value_counts: Optional[pd.Series] = None
+) -> dict[str, Any]:
+    """Compute statistics for a categorical/string column.
+
+    ``value_counts`` may be passed in when the caller already has
+    ``series.value_counts()``; all statistics are derived from it, so the
+    column itself is not scanned again.
+    """
+    if value_counts is None:
+        value_counts = count_values(series)
+    if value_counts.empty:
         return {}
-    value_counts = clean.value_counts()
     top_n = value_counts.head(10)
+    # Lengths are computed per distinct value and weighted by frequency
+    lengths = pd.Series(value_counts.index.astype(str)).str.len().to_numpy()
+    counts = value_counts.to_numpy()
     return {
         "top_values": {str(k): int(v) for k, v in top_n.items()},
-        "mode": str(value_counts.index[0]) if len(value_counts) > 0 else None,
-        "avg_length": float(clean.astype(str).str.len().mean()),
-        "min_length": int(clean.astype(str).str.len().min()),
-        "max_length": int(clean.astype(str).str.len().max()),
+        "mode": str(value_counts.index[0]),
+        "avg_length": float((lengths * counts).sum() / counts.sum()),
+        "min_length": int(lengths.min()),
+        "max_length": int(lengths.max()),
     }
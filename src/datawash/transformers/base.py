@@ -9,6 +9,19 @@ import pandas as pd
 
 from datawash.core.models import TransformationResult
 
+_PANDAS_COW = int(pd.__version__.split(".")[0]) >= 3
+
+
+def copy_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy ``df`` so writes to the result never reach ``df``.
+
+    Under Copy-on-Write (always on in pandas 3, opt-in in pandas 2) a shallow
+    copy is enough: only the columns later written to get copied.
+    """
+    if _PANDAS_COW or pd.options.mode.copy_on_write is True:
+        return df.copy(deep=False)
+    return df.copy()
+
 
 class BaseTransformer(ABC):
     @property
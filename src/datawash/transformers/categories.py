@@ -7,7 +7,7 @@ from typing import Any
 import pandas as pd
 
 from datawash.core.models import TransformationResult
-from datawash.transformers.base import BaseTransformer
+from datawash.transformers.base import BaseTransformer, copy_frame
 from datawash.transformers.registry import register_transformer
 
 
@@ -21,7 +21,7 @@ class CategoryTransformer(BaseTransformer):
     ) -> tuple[pd.DataFrame, TransformationResult]:
         columns = params.get("columns", [])
         mapping = params.get("mapping", {})
-        result_df = df.copy()
+        result_df = copy_frame(df)
         affected = 0
 
         for col in columns:
@@ -9,12 +9,33 @@ import numpy as np
 import pandas as pd
 
 from datawash.core.models import TransformationResult
-from datawash.transformers.base import BaseTransformer
+from datawash.transformers.base import BaseTransformer, copy_frame
 from datawash.transformers.registry import register_transformer
 
 logger = logging.getLogger(__name__)
 
 
+def _fill_median(series: pd.Series) -> tuple[pd.Series, int]:
+    """Fill nulls in a numeric series with its median.
+
+    Returns the filled series and the number of values filled. Float columns
+    are filled with ``np.where`` on the underlying array; other numeric dtypes
+    (nullable integers, etc.) go through ``fillna``.
+    """
+    if series.dtype.kind == "f" and isinstance(series.dtype, np.dtype):
+        values = series.to_numpy()
+        mask = np.isnan(values)
+        n_missing = int(mask.sum())
+        if n_missing == 0 or n_missing == len(values):
+            return series, n_missing  # nothing to fill, or no median to fill with
+        filled = np.where(mask, np.median(values[~mask]), values)
+        return pd.Series(filled, index=series.index, name=series.name), n_missing
+    n_missing = int(series.isna().sum())
+    if n_missing == 0:
+        return series, 0
+    return series.fillna(series.median()), n_missing
+
+
 class MissingTransformer(BaseTransformer):
     @property
     def name(self) -> str:
@@ -25,7 +46,7 @@ class MissingTransformer(BaseTransformer):
     ) -> tuple[pd.DataFrame, TransformationResult]:
         strategy = params.get("strategy", "drop_rows")
         columns = params.get("columns", list(df.columns))
-        result_df = df.copy()
+        result_df = copy_frame(df)
         rows_before = len(result_df)
         affected = 0
 
@@ -35,9 +56,8 @@ class MissingTransformer(BaseTransformer):
         elif strategy == "fill_median":
             for col in columns:
                 if pd.api.types.is_numeric_dtype(result_df[col]):
-                    median = result_df[col].median()
-                    affected += int(result_df[col].isna().sum())
-                    result_df[col] = result_df[col].fillna(median)
+                    result_df[col], filled = _fill_median(result_df[col])
+                    affected += filled
         elif strategy == "fill_mode":
             for col in columns:
                 mode = result_df[col].mode()
@@ -88,9 +108,7 @@ class MissingTransformer(BaseTransformer):
                             result_df[col] = result_df[col].fillna(mode.iloc[0])
                     elif fill_strategy == "median":
                         if pd.api.types.is_numeric_dtype(result_df[col]):
-                            result_df[col] = result_df[col].fillna(
-                                result_df[col].median()
-                            )
+                            result_df[col], _ = _fill_median(result_df[col])
                     elif fill_strategy == "value":
                         fill_value = params.get("fill_value", "")
                         result_df[col] = result_df[col].fillna(fill_value)
@@ -7,9 +7,15 @@ from typing import Any
 import pandas as pd
 
 from datawash.core.models import TransformationResult
-from datawash.transformers.base import BaseTransformer
+from datawash.transformers.base import BaseTransformer, copy_frame
 from datawash.transformers.registry import register_transformer
 
+# Lowercased spellings accepted for boolean conversion
+_BOOL_MAP: dict[str, bool] = {
+    **dict.fromkeys(("true", "yes", "y", "1", "t", "on"), True),
+    **dict.fromkeys(("false", "no", "n", "0", "f", "off"), False),
+}
+
 
 class TypeTransformer(BaseTransformer):
     @property
@@ -21,7 +27,7 @@ class TypeTransformer(BaseTransformer):
     ) -> tuple[pd.DataFrame, TransformationResult]:
         columns = params.get("columns", [])
         target_type = params.get("target_type", "numeric")
-        result_df = df.copy()
+        result_df = copy_frame(df)
         affected = 0
 
         for col in columns:
@@ -32,22 +38,15 @@ class TypeTransformer(BaseTransformer):
                 affected += int((converted != result_df[col].astype(str)).sum())
                 result_df[col] = converted
             elif target_type == "boolean":
-                bool_map = {
-                    "true": True,
-                    "false": False,
-                    "yes": True,
-                    "no": False,
-                    "y": True,
-                    "n": False,
-                    "1": True,
-                    "0": False,
-                    "t": True,
-                    "f": False,
-                    "on": True,
-                    "off": False,
-                }
-                result_df[col] = result_df[col].astype(str).str.lower().map(bool_map)
-                affected += len(result_df[col].dropna())
+                result_df[col] = (
+                    result_df[col]
+                    .astype(str)
+                    .str.strip()
+                    .str.lower()
+                    .map(_BOOL_MAP)
+                    .astype("boolean")
+                )
+                affected += int(result_df[col].notna().sum())
             elif target_type == "datetime":
                 result_df[col] = pd.to_datetime(result_df[col], errors="coerce")
                 affected += int(result_df[col].notna().sum())
@@ -73,15 +72,10 @@ class TypeTransformer(BaseTransformer):
                     f"df[{repr(col)}] = pd.to_numeric(df[{repr(col)}], errors='coerce')"
                 )
             elif target_type == "boolean":
-                bmap = (
-                    "{'true': True, 'false': False, "
-                    "'yes': True, 'no': False, "
-                    "'y': True, 'n': False, "
-                    "'1': True, '0': False}"
-                )
                 lines.append(
                     f"df[{repr(col)}] = df[{repr(col)}]"
-                    f".astype(str).str.lower().map({bmap})"
+                    f".astype(str).str.strip().str.lower()"
+                    f".map({_BOOL_MAP!r}).astype('boolean')"
                 )
             elif target_type == "datetime":
                 lines.append(
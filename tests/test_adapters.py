@@ -33,3 +33,142 @@ def test_load_json(tmp_path: Path, sample_df: pd.DataFrame) -> None:
     sample_df.to_json(path, orient="records")
     result = load_dataframe(path)
     assert len(result) == len(sample_df)
+
+
+def test_load_json_matches_pandas(tmp_path: Path) -> None:
+    path = tmp_path / "test.json"
+    path.write_text(
+        '[{"id": 1, "created_at": "2024-01-05", "modified": 1700000000000,'
+        ' "code": "7", "score": 2.0},'
+        ' {"id": 2, "created_at": "2024-02-06", "modified": 1700000360000,'
+        ' "code": "8", "score": 3.0}]'
+    )
+    pd.testing.assert_frame_equal(load_dataframe(path), pd.read_json(path))
+
+
+def test_load_csv_matches_pandas(tmp_path: Path) -> None:
+    path = tmp_path / "test.csv"
+    path.write_text(
+        "id,joined,score,name\n"
+        "1,2023-01-15,1.5,Alice\n"
+        "2,2023-02-20,,\n"
+        "3,2023-03-25,2.5, Bob \n"
+    )
+    result = load_dataframe(path)
+    pd.testing.assert_frame_equal(result, pd.read_csv(path))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "a,b\nNone,1\nx,NA\nn/a,2\n",  # pandas' NA tokens
+        "a,,c\n1,2,3\n4,5,6\n",  # blank header
+        "a,b\n1,\n2,\n",  # all-empty column
+        "a,b\n1,18446744073709551615\n2,1\n",  # beyond int64
+    ],
+)
+def test_load_csv_matches_pandas_edge_cases(tmp_path: Path, text: str) -> None:
+    path = tmp_path / "test.csv"
+    path.write_text(text)
+    pd.testing.assert_frame_equal(load_dataframe(path), pd.read_csv(path))
+
+
+def test_load_csv_chunks(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    path = tmp_path / "test.csv"
+    sample_df.to_csv(path, index=False)
+    chunks = list(load_dataframe(path, chunksize=4))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert list(chunks[0].columns) == list(sample_df.columns)
+
+
+def test_load_parquet_chunks(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "test.parquet"
+    sample_df.to_parquet(path, index=False)
+    chunks = list(load_dataframe(path, chunksize=4))
+    assert sum(len(c) for c in chunks) == len(sample_df)
+
+
+def test_load_chunks_unsupported_format(
+    tmp_path: Path, sample_df: pd.DataFrame
+) -> None:
+    path = tmp_path / "test.json"
+    sample_df.to_json(path, orient="records")
+    with pytest.raises(AdapterError, match="Chunked reading is not supported"):
+        load_dataframe(path, chunksize=4)
+
+
+def test_load_csv_usecols(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    path = tmp_path / "test.csv"
+    sample_df.to_csv(path, index=False)
+    result = load_dataframe(path, usecols=["salary", "id"])
+    assert list(result.columns) == ["id", "salary"]
+    assert len(result) == len(sample_df)
+
+
+def test_load_csv_with_pandas_options(tmp_path: Path) -> None:
+    path = tmp_path / "test.csv"
+    path.write_text("a;b\n1;x\n2;y\n")
+    result = load_dataframe(path, sep=";")
+    assert list(result.columns) == ["a", "b"]
+    result = load_dataframe(path, sep=";", engine="python")
+    assert len(result) == 2
+
+
+def test_writer_lookup_registers_lazily():
+    from datawash.adapters.base import get_writer
+
+    assert get_writer("json") is not None
+    assert get_writer("txt") is None
+
+
+def test_json_round_trip(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    from datawash.adapters.base import get_writer
+
+    path = tmp_path / "out.json"
+    get_writer("json")(sample_df, path)
+    result = load_dataframe(path)
+    assert list(result.columns) == list(sample_df.columns)
+    assert len(result) == len(sample_df)
+
+
+def test_load_parquet_columns(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "test.parquet"
+    sample_df.to_parquet(path, index=False)
+    cols = list(sample_df.columns[:2])
+    result = load_dataframe(path, columns=cols)
+    pd.testing.assert_frame_equal(result, pd.read_parquet(path, columns=cols))
+
+
+def test_write_csv_fast_round_trip(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    from datawash.adapters.csv_adapter import write_csv_fast
+
+    path = tmp_path / "out.csv"
+    write_csv_fast(sample_df, path)
+    # Whole floats are written without ".0", so they read back as integers
+    pd.testing.assert_frame_equal(load_dataframe(path), sample_df, check_dtype=False)
+
+
+def test_write_csv_fast_mixed_object_column(tmp_path: Path) -> None:
+    from datawash.adapters.csv_adapter import write_csv_fast
+
+    path = tmp_path / "out.csv"
+    write_csv_fast(pd.DataFrame({"o": [1, "x", 2.5]}), path)
+    assert load_dataframe(path)["o"].tolist() == ["1", "x", "2.5"]
+
+
+def test_write_csv_pyarrow_rejects_options(tmp_path: Path) -> None:
+    from datawash.adapters.csv_adapter import CsvAdapter
+
+    with pytest.raises(ValueError, match="sep"):
+        CsvAdapter().write(
+            pd.DataFrame({"a": [1]}), tmp_path / "out.csv", "pyarrow", sep=";"
+        )
+
+
+def test_load_csv_without_fast_io(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    path = tmp_path / "test.csv"
+    sample_df.to_csv(path, index=False)
+    result = load_dataframe(path, fast_io=False)
+    pd.testing.assert_frame_equal(result, pd.read_csv(path))
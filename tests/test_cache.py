@@ -29,7 +29,7 @@ class TestComputationCache:
         cache = ComputationCache(sample_df)
         mask = cache.get_null_mask("int_col")
         assert mask.sum() == 1
-        assert mask.iloc[3] == True  # noqa: E712
+        assert mask[3]
 
     def test_value_set_cached(self, sample_df):
         cache = ComputationCache(sample_df)
@@ -49,12 +49,41 @@ class TestComputationCache:
         values = cache.get_value_set("col", max_values=100)
         assert len(values) <= 100
 
+    def test_null_masks_computed_per_block(self):
+        df = pd.DataFrame({f"c{i}": [1.0, None, 3.0] for i in range(300)})
+        cache = ComputationCache(df)
+        assert cache.get_null_mask("c5").tolist() == [False, True, False]
+        assert len(cache._null_masks) == 256
+        assert cache.get_null_mask("c299").tolist() == [False, True, False]
+        assert len(cache._null_masks) == 300
+
+    def test_unique_count_categorical_ignores_unused(self):
+        col = pd.Categorical(["a", "b", None, "a"], categories=["a", "b", "c"])
+        cache = ComputationCache(pd.DataFrame({"col": col}))
+        assert cache.get_unique_count("col") == 2
+
+    def test_value_set_mixed_object_column(self):
+        df = pd.DataFrame({"col": pd.Series(["x", 1, 2.5, "x"], dtype=object)})
+        cache = ComputationCache(df)
+        assert cache.get_value_set("col") == {"x", "1", "2.5"}
+
     def test_unique_count_cached(self, sample_df):
         cache = ComputationCache(sample_df)
         count1 = cache.get_unique_count("str_col")
         count2 = cache.get_unique_count("str_col")
         assert count1 == count2 == 3  # a, b, c (null not counted by nunique)
 
+    def test_value_counts_cached(self, sample_df):
+        cache = ComputationCache(sample_df)
+        counts = cache.get_value_counts("str_col")
+        assert counts is cache.get_value_counts("str_col")
+        assert counts.to_dict() == {"a": 2, "b": 1, "c": 1}
+
+    def test_value_counts_drop_unused_categories(self):
+        col = pd.Categorical(["x", "x", None], categories=["x", "y"])
+        cache = ComputationCache(pd.DataFrame({"cat": col}))
+        assert cache.get_unique_count("cat") == 1
+
     def test_statistics_numeric(self, sample_df):
         cache = ComputationCache(sample_df)
         stats = cache.get_statistics("float_col")
@@ -66,6 +95,28 @@ class TestComputationCache:
         assert "q3" in stats
         assert abs(stats["mean"] - 3.3) < 0.01
 
+    def test_statistics_match_pandas(self):
+        values = pd.Series([4.0, None, 1.5, 9.0, 2.0, None, 7.25, 3.0])
+        cache = ComputationCache(pd.DataFrame({"col": values}))
+        stats = cache.get_statistics("col")
+        clean = values.dropna()
+        assert stats == pytest.approx(
+            {
+                "mean": clean.mean(),
+                "std": clean.std(),
+                "min": clean.min(),
+                "max": clean.max(),
+                "q1": clean.quantile(0.25),
+                "q3": clean.quantile(0.75),
+            }
+        )
+
+    def test_statistics_small_int_quartiles(self):
+        df = pd.DataFrame({"col": np.array([-100, 100, 100, 100], dtype=np.int8)})
+        stats = ComputationCache(df).get_statistics("col")
+        assert stats["q1"] == 50.0
+        assert stats["q3"] == 100.0
+
     def test_statistics_cached(self, sample_df):
         cache = ComputationCache(sample_df)
         stats1 = cache.get_statistics("float_col")
@@ -13,6 +13,13 @@ from datawash.cli.main import app
 runner = CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "cache"
+    monkeypatch.setenv("DATAWASH_CACHE_DIR", str(path))
+    return path
+
+
 @pytest.fixture
 def csv_file(tmp_path: Path, messy_df: pd.DataFrame) -> Path:
     path = tmp_path / "test.csv"
@@ -87,3 +94,35 @@ def test_help() -> None:
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     assert "datawash" in result.output.lower() or "intelligent" in result.output.lower()
+
+
+def test_commands_reuse_cached_analysis(csv_file: Path, cache_dir: Path) -> None:
+    assert runner.invoke(app, ["analyze", str(csv_file), "--cache"]).exit_code == 0
+    cached = list((cache_dir / "reports").iterdir())
+    assert len(cached) == 1
+    result = runner.invoke(app, ["suggest", str(csv_file), "--cache"])
+    assert result.exit_code == 0
+    assert list((cache_dir / "reports").iterdir()) == cached
+
+
+def test_cache_off_by_default(csv_file: Path, cache_dir: Path) -> None:
+    result = runner.invoke(app, ["analyze", str(csv_file)])
+    assert result.exit_code == 0
+    assert not cache_dir.exists()
+
+
+def test_analyze_streaming(csv_file: Path) -> None:
+    result = runner.invoke(app, ["analyze", str(csv_file), "--streaming"])
+    assert result.exit_code == 0
+    assert "Column Profiles" in result.output
+
+
+def test_cli_import_does_not_load_pandas() -> None:
+    import subprocess
+    import sys
+
+    code = "import sys, datawash.cli.main; print('pandas' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
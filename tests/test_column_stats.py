@@ -0,0 +1,57 @@
+"""Tests for shared per-column string statistics."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from datawash.core import column_stats
+from datawash.core.column_stats import scan_column
+from datawash.profiler import profile_dataset
+
+
+def test_non_string_column_has_no_stats() -> None:
+    assert scan_column(pd.Series([1, 2, 3])) is None
+
+
+def test_counts_are_weighted_by_frequency() -> None:
+    series = pd.Series([" a", " a", "b ", "", "  ", None, "Yes"])
+    stats = scan_column(series)
+    assert stats is not None
+    assert stats.non_null_count == 6
+    assert stats.empty_count == 2
+    assert stats.leading_whitespace == 3  # " a" twice plus "  "
+    assert stats.trailing_whitespace == 2  # "b " and "  "
+
+
+def test_case_and_padding_flags() -> None:
+    stats = scan_column(pd.Series(["\tABC", "abc\u00a0", "Abc", "123"]))
+    assert (stats.leading_whitespace, stats.trailing_whitespace) == (1, 1)
+    assert stats.has_upper and stats.has_lower and stats.has_title
+    stats = scan_column(pd.Series(["abc", "def", "123"]))
+    assert (stats.has_upper, stats.has_lower, stats.has_title) == (False, True, False)
+
+
+def test_padding_without_pyarrow(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(column_stats, "pa", None)
+    stats = scan_column(pd.Series(["\tABC", "abc\u00a0", "\u3000x ", "x"]))
+    assert (stats.leading_whitespace, stats.trailing_whitespace) == (2, 2)
+
+
+def test_boolean_values_only_for_boolean_vocabulary() -> None:
+    assert scan_column(pd.Series(["Yes", " no", "YES"])).boolean_values == [
+        "no",
+        "yes",
+    ]
+    assert scan_column(pd.Series(["yes", "maybe"])).boolean_values == []
+
+
+def test_date_format_counts() -> None:
+    stats = scan_column(pd.Series(["2024-01-01", "01/02/2024", "01/03/2024"]))
+    assert stats.date_format_counts == {"iso": 1, "slash_mdy": 2}
+
+
+def test_profile_carries_text_stats(messy_df: pd.DataFrame) -> None:
+    profile = profile_dataset(messy_df)
+    assert profile.columns["name"].text_stats is not None
+    assert profile.columns["name"].text_stats.leading_whitespace == 1
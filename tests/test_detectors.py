@@ -53,6 +53,19 @@ class TestOutlierDetector:
         findings = det.detect(messy_df, profile)
         assert isinstance(findings, list)
 
+    def test_float32_columns_match_float64(self) -> None:
+        values = [0.1 * i for i in range(40)] + [55.5, None, -30.25]
+        df32 = pd.DataFrame({"x": values, "n": range(43)}).astype(
+            {"x": "float32", "n": "int16"}
+        )
+        df64 = df32.astype("float64")
+        found32 = OutlierDetector().detect(df32, profile_dataset(df32))
+        found64 = OutlierDetector().detect(df64, profile_dataset(df64))
+        assert [(f.columns, f.rows, f.details) for f in found32] == [
+            (f.columns, f.rows, f.details) for f in found64
+        ]
+        assert found32[0].rows == [40, 42]
+
 
 class TestTypeDetector:
     def test_detects_numeric_as_string(self, messy_df: pd.DataFrame) -> None:
@@ -82,6 +95,17 @@ class TestFormatDetector:
         ws_findings = [f for f in findings if f.issue_type == "whitespace_padding"]
         assert len(ws_findings) >= 1
 
+    def test_checks_categorical_text_only(self) -> None:
+        df = pd.DataFrame(
+            {
+                "n": range(6),
+                "code": pd.Categorical([" a", "b", "c ", "d", "e", "f"]),
+            }
+        )
+        profile = profile_dataset(df)
+        findings = FormatDetector().detect(df, profile)
+        assert [f.columns for f in findings] == [["code"]]
+
 
 class TestFormatDetectorDates:
     def test_detects_mixed_date_formats(self) -> None:
@@ -205,6 +229,55 @@ class TestSimilarityDetector:
         findings = SimilarityDetector().detect(df, profile)
         assert len(findings) >= 1
 
+    def test_value_overlap_found_without_name_overlap(self) -> None:
+        codes = [f"code-{i}" for i in range(200)]
+        df = pd.DataFrame({"qx": codes, "zw": codes, "n": range(200)})
+        detector = SimilarityDetector()
+        sets = {0: set(codes), 1: set(codes), 2: {str(i) for i in range(200)}}
+        assert detector._minhash_lsh_blocking(list(df.columns), sets) == {(0, 1)}
+        assert detector._ngram_blocking(list(df.columns)) == set()
+
+    def test_batched_signatures_match_single_sets(self) -> None:
+        detector = SimilarityDetector()
+        big = {f"v{i}" for i in range(9000)}  # spans several hash blocks
+        sets = [{"a", "b"}, set(), big, {"b", "a"}, {"z"}]
+        batched = detector._minhash_signatures(sets)
+        assert not batched[1].any()
+        assert (batched[0] == batched[3]).all()
+        for i, values in enumerate(sets):
+            assert (detector._minhash_signatures([values])[0] == batched[i]).all()
+
+    def test_band_buckets_group_identical_rows(self) -> None:
+        detector = SimilarityDetector()
+        sets = [{"b"}, {"a"}, {"b"}, {"a"}, {"c"}, {"a"}]
+        signatures = detector._minhash_signatures(sets)
+        assert detector._band_buckets(signatures[:, :5]) == [[0, 2], [1, 3, 5]]
+
+    def test_levenshtein_cutoff(self) -> None:
+        detector = SimilarityDetector()
+        assert detector._normalized_levenshtein("kitten", "sitting") == pytest.approx(
+            1 - 3 / 7
+        )
+        assert detector._normalized_levenshtein(
+            "kitten", "sitting", min_similarity=0.5
+        ) == pytest.approx(1 - 3 / 7)
+        assert (
+            detector._normalized_levenshtein("kitten", "sitting", min_similarity=0.9)
+            == 0.0
+        )
+        assert detector._bounded_distance("order_total_2024", "order_tax_2024", 9) == 3
+
+    def test_c_levenshtein_matches_fallback(self) -> None:
+        levenshtein = pytest.importorskip("Levenshtein")
+        names = ["", "kitten", "sitting", "order_total_2024", "order_tax_2024", "id"]
+        for s1 in names:
+            for s2 in names:
+                for cutoff in (0, 1, 3, 20):
+                    fallback = SimilarityDetector._bounded_distance(s1, s2, cutoff)
+                    assert levenshtein.distance(s1, s2, score_cutoff=cutoff) == min(
+                        fallback, cutoff + 1
+                    )
+
     def test_no_similar_columns(self, sample_df: pd.DataFrame) -> None:
         profile = profile_dataset(sample_df)
         findings = SimilarityDetector().detect(sample_df, profile)
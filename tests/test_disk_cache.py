@@ -0,0 +1,99 @@
+"""Tests for the on-disk cache."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from datawash import analyze
+from datawash.adapters import load_dataframe
+from datawash.core import disk_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv("DATAWASH_CACHE_DIR", str(path))
+    return path
+
+
+class TestFingerprints:
+    def test_file_fingerprint_changes_with_content(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a\n1\n")
+        before = disk_cache.file_fingerprint(path)
+        path.write_text("a\n2\n")
+        assert disk_cache.file_fingerprint(path) != before
+
+    def test_frame_fingerprint_stable(self, sample_df):
+        assert disk_cache.frame_fingerprint(sample_df) == disk_cache.frame_fingerprint(
+            sample_df.copy()
+        )
+
+    def test_frame_fingerprint_includes_extra(self, sample_df):
+        assert disk_cache.frame_fingerprint(
+            sample_df, "ml"
+        ) != disk_cache.frame_fingerprint(sample_df, "general")
+
+    def test_frame_fingerprint_distinguishes_object_types(self):
+        ints = pd.DataFrame({"x": pd.Series([1, 2, 3, 4, 5, 6] * 3, dtype=object)})
+        text = pd.DataFrame({"x": pd.Series(list("123456") * 3, dtype=object)})
+        mixed = pd.DataFrame({"x": pd.Series([1, "1"], dtype=object)})
+        flipped = pd.DataFrame({"x": pd.Series(["1", 1], dtype=object)})
+        assert disk_cache.frame_fingerprint(ints) != disk_cache.frame_fingerprint(text)
+        assert disk_cache.frame_fingerprint(mixed) != disk_cache.frame_fingerprint(
+            flipped
+        )
+
+
+class TestLoadDataframeCache:
+    def test_cached_load_roundtrip(self, tmp_path, sample_df, cache_dir):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "data.csv"
+        sample_df.to_csv(path, index=False)
+        first = load_dataframe(path, cache=True)
+        assert list((cache_dir / "frames").iterdir())
+        second = load_dataframe(path, cache=True)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_no_cache_by_default(self, tmp_path, sample_df, cache_dir):
+        path = tmp_path / "data.csv"
+        sample_df.to_csv(path, index=False)
+        load_dataframe(path)
+        assert not cache_dir.exists()
+
+
+class TestAnalysisCache:
+    def test_cached_report_matches(self, messy_df, cache_dir):
+        first = analyze(messy_df, cache=True)
+        second = analyze(messy_df, cache=True)
+        assert list((cache_dir / "reports").iterdir())
+        assert second.quality_score == first.quality_score
+        assert [s.action for s in second.suggestions] == [
+            s.action for s in first.suggestions
+        ]
+
+    def test_use_case_changes_key(self, messy_df, cache_dir):
+        analyze(messy_df, use_case="general", cache=True)
+        analyze(messy_df, use_case="ml", cache=True)
+        assert len(list((cache_dir / "reports").iterdir())) == 2
+
+    def test_apply_result_cached(self, messy_df, cache_dir):
+        ids = [s.id for s in analyze(messy_df, cache=True).suggestions]
+        first = analyze(messy_df, cache=True).apply(ids)
+        report = analyze(messy_df, cache=True)
+        second = report.apply(list(reversed(ids)))
+        assert len(list((cache_dir / "apply").iterdir())) == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert report.generate_code()
+
+
+def test_evict_removes_oldest(cache_dir):
+    disk_cache.store_object("objs", "old", b"x" * 100)
+    disk_cache.store_object("objs", "new", b"x" * 100)
+    old = cache_dir / "objs" / "old.pkl"
+    new = cache_dir / "objs" / "new.pkl"
+    os.utime(old, (1, 1))
+    disk_cache.evict(max_bytes=150)
+    assert not old.exists()
+    assert new.exists()
@@ -64,3 +64,35 @@ class TestOptimizeDataframe:
         df = pd.DataFrame()
         optimized = optimize_dataframe(df)
         assert len(optimized.columns) == 0
+
+    def test_picks_smallest_fitting_types(self):
+        df = pd.DataFrame(
+            {
+                "small": [1, 2, 3],
+                "medium": [-200, 0, 300],
+                "large": [0, 2**40, 1],
+                "exact": [0.5, 1.5, np.nan],
+                "precise": [1e10 + 0.5, 1.0, 2.0],
+            }
+        )
+        optimized = optimize_dataframe(df)
+        assert optimized.dtypes.astype(str).tolist() == [
+            "int8",
+            "int16",
+            "int64",
+            "float32",
+            "float64",
+        ]
+
+    def test_f32_precision_forces_float32(self):
+        df = pd.DataFrame(
+            {"precise": [1e10 + 0.5, 1.0, 2.0], "huge": [1e300, 0.0, 1.0]}
+        )
+        optimized = optimize_dataframe(df, numeric_precision="f32")
+        assert optimized["precise"].dtype == np.float32
+        assert optimized["huge"].dtype == np.float64
+
+    def test_f32_precision_with_duplicate_columns(self):
+        df = pd.DataFrame([[1e10 + 0.5, 1e300], [1.0, 0.0]], columns=["x", "x"])
+        optimized = optimize_dataframe(df, numeric_precision="f32")
+        assert optimized.dtypes.astype(str).tolist() == ["float32", "float64"]
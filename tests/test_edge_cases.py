@@ -56,6 +56,12 @@ class TestProfilerEdgeCases:
         patterns = detect_column_patterns(series)
         assert "email" in patterns
 
+    def test_pattern_detection_date(self) -> None:
+        series = pd.Series(["2020-01-05 10:00:00", "2021-03-09 08:30:00"] * 10)
+        patterns = detect_column_patterns(series)
+        assert patterns["date"] == {"match_ratio": 1.0, "format": "%Y-%m-%d %H:%M:%S"}
+        assert "date" not in detect_column_patterns(pd.Series(["True", "False"] * 10))
+
     def test_pattern_detection_empty(self) -> None:
         series = pd.Series([], dtype=str)
         patterns = detect_column_patterns(series)
@@ -24,6 +24,55 @@ def test_full_workflow(messy_df: pd.DataFrame) -> None:
     assert len(code) > 50
 
 
+def test_apply_leaves_original_untouched(messy_df: pd.DataFrame) -> None:
+    original = messy_df.copy()
+    report = analyze(messy_df)
+    report.apply_all()
+    df = report.df
+    df.iloc[0, 0] = "changed"
+    pd.testing.assert_frame_equal(report.df, original)
+
+
+def test_suggestions_by_priority(messy_df: pd.DataFrame) -> None:
+    report = analyze(messy_df)
+    high = report.suggestions_by_priority("high")
+    assert high
+    assert high == [s for s in report.suggestions if s.priority.value == "high"]
+    high.clear()
+    assert report.suggestions_by_priority("high")
+    assert report.suggestions_by_priority("urgent") == []
+
+
+def test_apply_memoized_by_id_set(messy_df: pd.DataFrame) -> None:
+    report = analyze(messy_df)
+    ids = [s.id for s in report.suggestions]
+    first = report.apply(ids)
+    first.iloc[0, 0] = "changed"
+    second = report.apply(list(reversed(ids)))
+    assert second.iloc[0, 0] != "changed"
+    assert len(report._applied) == len(ids)
+
+
+def test_apply_keeps_only_last_result(messy_df: pd.DataFrame) -> None:
+    report = analyze(messy_df)
+    ids = [s.id for s in report.suggestions]
+    report.apply(ids)
+    report.apply(ids[:1])
+    assert report._last_apply is not None
+    assert report._last_apply[0] == (ids[0],)
+    assert len(report._applied) == 1
+
+
+def test_generate_code_cached_until_next_apply(messy_df: pd.DataFrame) -> None:
+    report = analyze(messy_df)
+    report.apply_all()
+    code = report.generate_code(style="script")
+    assert report.generate_code(style="script") is code
+
+    report.apply([report.suggestions[0].id])
+    assert report.generate_code(style="script") != code
+
+
 def test_selective_apply(messy_df: pd.DataFrame) -> None:
     """Test applying specific suggestions."""
     report = analyze(messy_df)
@@ -101,3 +150,117 @@ def test_apply_stores_quality_scores(messy_df: pd.DataFrame) -> None:
     assert hasattr(report, "_last_score_before")
     assert hasattr(report, "_last_score_after")
     assert report._last_score_after >= report._last_score_before
+
+
+@pytest.mark.skipif(int(pd.__version__.split(".")[0]) < 3, reason="needs Copy-on-Write")
+def test_report_isolated_from_later_source_edits(messy_df: pd.DataFrame) -> None:
+    original = messy_df.copy()
+    report = analyze(messy_df)
+    messy_df.iloc[0, 0] = "changed"
+    pd.testing.assert_frame_equal(report.df, original)
+
+
+def test_compile_pipeline_matches_apply(messy_df: pd.DataFrame) -> None:
+    report = analyze(messy_df)
+    clean_df = report.apply_all()
+    pipeline = report.compile_pipeline()
+    pd.testing.assert_frame_equal(pipeline(messy_df), clean_df)
+    assert report.compile_pipeline() is pipeline
+
+
+def test_compile_pipeline_without_suggestions() -> None:
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    pipeline = analyze(df).compile_pipeline()
+    result = pipeline(df)
+    pd.testing.assert_frame_equal(result, df)
+    assert result is not df
+
+
+def test_incremental_score_matches_full_rescan(messy_df: pd.DataFrame) -> None:
+    from datawash.core.report import _score_from_findings
+    from datawash.detectors import run_all_detectors
+    from datawash.profiler import profile_dataset
+
+    report = analyze(messy_df)
+    for suggestion in report.suggestions:
+        result = report.apply([suggestion.id])
+        profile = profile_dataset(result)
+        expected = _score_from_findings(
+            run_all_detectors(result, profile), profile.row_count
+        )
+        assert report._last_score_after == expected
+
+
+def test_repeated_report_reuses_analysis(
+    messy_df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = analyze(messy_df)
+
+    def fail(*args: object) -> None:
+        raise AssertionError("analysis should have been reused")
+
+    monkeypatch.setattr(Report, "_analyze", fail)
+    second = analyze(messy_df.copy())
+    assert second.quality_score == first.quality_score
+    messy_df.loc[0, "age"] = "unknown"
+    with pytest.raises(AssertionError):
+        analyze(messy_df)
+
+
+def test_analysis_memo_tells_object_types_apart() -> None:
+    a = pd.DataFrame({"x": pd.Series([1, 2, 3, 4, 5, 6] * 3, dtype=object)})
+    b = pd.DataFrame({"x": pd.Series(["1", "2", "3", "4", "5", "6"] * 3, dtype=object)})
+    expected = [f.issue_type for f in analyze(a).issues]
+    analyze(b)
+    assert [f.issue_type for f in analyze(a).issues] == expected
+
+
+def test_reused_analysis_not_shared(messy_df: pd.DataFrame) -> None:
+    first = analyze(messy_df)
+    second = analyze(messy_df)
+    assert second.profile is not first.profile
+    first.profile.columns.clear()
+    first.suggestions[0].params["mutated"] = True
+    third = analyze(messy_df)
+    assert third.profile.columns
+    assert "mutated" not in third.suggestions[0].params
+
+
+def test_sampled_report_skips_fingerprint_without_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(*args: object) -> None:
+        raise AssertionError("sampled frames should not be hashed")
+
+    monkeypatch.setattr(Report, "_analysis_cache_key", fail)
+    report = analyze(pd.DataFrame({"a": range(50_000)}))
+    assert report.profile.row_count == 50_000
+
+
+def test_rescore_runs_serially_without_parallel(
+    messy_df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from datawash.core import report as report_module
+
+    workers: list[object] = []
+    run_detectors = report_module.run_detectors
+
+    def record(*args: object, **kwargs: object) -> object:
+        workers.append(args[3])
+        return run_detectors(*args, **kwargs)
+
+    monkeypatch.setattr(report_module, "run_detectors", record)
+    Report(messy_df, parallel=False).apply_all()
+    assert workers and set(workers) == {1}
+
+
+def test_wide_small_frame_profiled_serially(monkeypatch: pytest.MonkeyPatch) -> None:
+    from datawash.profiler import parallel
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("small frames should be profiled serially")
+
+    monkeypatch.setattr(parallel, "profile_dataset_parallel", fail)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    report = analyze(pd.DataFrame({f"c{i}": range(1000) for i in range(30)}))
+    assert len(report.profile.columns) == 30
@@ -94,3 +94,11 @@ class TestParallelDetectors:
         parallel_types = sorted({f.issue_type for f in parallel_findings})
         sequential_types = sorted({f.issue_type for f in sequential_findings})
         assert parallel_types == sequential_types
+
+    def test_threaded_run_all_detectors_matches_serial(self, test_df):
+        from datawash.detectors import run_all_detectors
+
+        profile = profile_dataset(test_df)
+        threaded = run_all_detectors(test_df, profile, parallel=True)
+        serial = run_all_detectors(test_df, profile, parallel=False)
+        assert threaded == serial
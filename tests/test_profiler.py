@@ -1,9 +1,12 @@
 """Tests for the profiler."""
 
 from __future__ import annotations
+from pathlib import Path
+import numpy as np
 import pandas as pd
 import pytest
-from datawash.profiler import profile_dataset
+from datawash.profiler import profile_dataset, profile_file
+from datawash.profiler.streaming import profile_chunks
 
 
 def test_profile_basic(sample_df: pd.DataFrame) -> None:
@@ -24,6 +27,7 @@ def test_profile_with_nulls(messy_df: pd.DataFrame) -> None:
 def test_profile_duplicates(messy_df: pd.DataFrame) -> None:
     profile = profile_dataset(messy_df)
     assert profile.duplicate_row_count == 2
+    assert profile.duplicate_rows == messy_df.index[messy_df.duplicated()].tolist()
 
 
 def test_profile_numeric_stats(sample_df: pd.DataFrame) -> None:
@@ -45,3 +49,24 @@ def test_profile_single_row(single_row_df: pd.DataFrame) -> None:
     profile = profile_dataset(single_row_df)
     assert profile.row_count == 1
     assert profile.column_count == 2
+
+
+def test_streaming_profile_matches_full(messy_df: pd.DataFrame) -> None:
+    chunks = [messy_df.iloc[i : i + 3] for i in range(0, len(messy_df), 3)]
+    streamed = profile_chunks(chunks)
+    full = profile_dataset(messy_df)
+    assert streamed.row_count == full.row_count
+    assert streamed.duplicate_row_count == full.duplicate_row_count
+    for name, col in full.columns.items():
+        assert streamed.columns[name].null_count == col.null_count
+        assert streamed.columns[name].unique_count == col.unique_count
+        for key, value in streamed.columns[name].statistics.items():
+            assert value == pytest.approx(col.statistics[key])
+
+
+def test_streaming_distinct_estimate(tmp_path: Path) -> None:
+    path = tmp_path / "wide.csv"
+    pd.DataFrame({"id": np.arange(200_000)}).to_csv(path, index=False)
+    profile = profile_file(path, chunksize=50_000)
+    assert profile.columns["id"].unique_count == pytest.approx(200_000, rel=0.03)
+    assert profile.columns["id"].statistics["max"] == 199_999
@@ -66,3 +66,27 @@ class TestSmartSampler:
         df = pd.DataFrame({"a": range(n), "b": range(n)})
         sampler = SmartSampler(df)
         assert len(sampler.sample_df) < len(df)
+
+    def test_null_rows_removed_by_position(self):
+        n = SAMPLE_THRESHOLD + 10_000
+        df = pd.DataFrame(
+            {"a": [None if i % 50 == 0 else i for i in range(n)], "b": range(n)},
+            index=np.arange(n) % 1000,  # repeated labels
+        )
+        sampler = SmartSampler(df)
+        assert len(sampler.sample_df) == SAMPLE_SIZE
+        assert sampler.sample_df["a"].isna().sum() >= SAMPLE_SIZE // 10
+
+    def test_extrapolate_memory_close_to_deep_usage(self):
+        n = 100_000
+        df = pd.DataFrame(
+            {
+                "a": range(n),
+                "s": pd.Series(
+                    ["short", "a much longer value"] * (n // 2), dtype=object
+                ),
+            }
+        )
+        sampler = SmartSampler(df)
+        actual = df.memory_usage(deep=True).sum()
+        assert sampler.extrapolate_memory(df) == pytest.approx(actual, rel=0.05)
@@ -92,6 +92,15 @@ class TestTypeTransformer:
         assert result_df["a"].iloc[0] == True
         assert result_df["a"].iloc[1] == False
 
+    def test_to_boolean_mixed_spellings(self) -> None:
+        df = pd.DataFrame({"a": [" Yes", "NO ", None, "maybe", "t"]})
+        result_df, result = run_transformer(
+            "types", df, columns=["a"], target_type="boolean"
+        )
+        assert result_df["a"].dtype == "boolean"
+        assert result_df["a"].tolist() == [True, False, pd.NA, pd.NA, True]
+        assert result.rows_affected == 3
+
 
 class TestFormatTransformer:
     def test_strip_whitespace(self) -> None:
@@ -141,3 +150,21 @@ class TestCategoryTransformer:
             mapping={"USA": "US", "United States": "US"},
         )
         assert result_df["a"].tolist() == ["US", "US", "US"]
+
+
+@pytest.mark.parametrize(
+    "name, params",
+    [
+        ("missing", {"strategy": "fill_median", "columns": ["a"]}),
+        ("formats", {"columns": ["b"], "operation": "strip_whitespace"}),
+        ("categories", {"columns": ["b"]}),
+        ("types", {"columns": ["c"], "target_type": "numeric"}),
+        ("columns", {"operation": "rename", "mapping": {"a": "z"}}),
+    ],
+)
+def test_input_frame_unchanged(name: str, params: dict) -> None:
+    df = pd.DataFrame({"a": [1.0, None, 3.0], "b": [" X", "y ", "Z"], "c": list("123")})
+    expected = df.copy()
+    result_df, _ = run_transformer(name, df, **params)
+    assert not result_df.equals(df)
+    pd.testing.assert_frame_equal(df, expected)